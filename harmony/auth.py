@@ -12,20 +12,32 @@ to perform authentication with Earthdata Login. The ``create_session`` function
 uses this class and clients of the Harmony Py package do not need to use this
 explicitly.
 """
-import re
+from base64 import b64encode
+from functools import lru_cache
+import weakref
 from typing import Optional, Tuple, cast
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from requests import Session
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.auth import HTTPBasicAuth
 from requests.models import PreparedRequest, Response
 from requests.utils import get_netrc_auth
+from urllib3.util.retry import Retry
 
 from harmony.config import Config
 
+_EDL_HOSTNAME_SUFFIX = 'urs.earthdata.nasa.gov'
 
+# Sessions whose credentials have already been validated against EDL
+_validated_sessions = weakref.WeakSet()
+
+
+@lru_cache(maxsize=128)
 def _is_edl_hostname(hostname: str) -> bool:
     """
-    Determine if a hostname matches an EDL hostname.
+    Determine if a hostname matches an EDL hostname. Results are cached since redirects
+    only ever visit a handful of hosts.
 
     Args:
         hostname: A fully-qualified domain name (FQDN).
@@ -33,8 +45,34 @@ def _is_edl_hostname(hostname: str) -> bool:
     Returns:
         True if the hostname is an EDL hostname, else False.
     """
-    edl_hostname_pattern = r'.*urs\.earthdata\.nasa\.gov$'
-    return re.fullmatch(edl_hostname_pattern, hostname, flags=re.IGNORECASE) is not None
+    return hostname.lower().endswith(_EDL_HOSTNAME_SUFFIX)
+
+
+def _hostname(url: str) -> Optional[str]:
+    """
+    Extract the hostname from a URL.
+
+    Args:
+        url: A fully-qualified URL.
+
+    Returns:
+        The lowercased hostname of the URL, or None if it has none.
+    """
+    return urlsplit(url).hostname
+
+
+def _scheme_host_prefix(url: str) -> str:
+    """
+    Return the leading ``scheme://netloc`` portion of a URL, i.e. everything before the
+    third '/'. URLs with equal prefixes are guaranteed to have the same hostname.
+
+    Args:
+        url: A fully-qualified URL.
+
+    Returns:
+        The URL's scheme and network location prefix.
+    """
+    return '/'.join(url.split('/', 3)[:3])
 
 
 class MalformedCredentials(Exception):
@@ -47,6 +85,26 @@ class BadAuthentication(Exception):
     pass
 
 
+class PrecomputedBasicAuth(HTTPBasicAuth):
+    """HTTP Basic Authentication whose Authorization header value is encoded once,
+    rather than on every request sent by the session.
+
+    Args:
+        username: An EDL username
+        password: An EDL password
+    """
+
+    def __init__(self, username: str, password: str) -> None:
+        super().__init__(username, password)
+        # Encoded as latin1, as requests does for HTTPBasicAuth
+        credentials = f'{username}:{password}'.encode('latin1')
+        self.header = f'Basic {b64encode(credentials).decode("ascii")}'
+
+    def __call__(self, r: PreparedRequest) -> PreparedRequest:
+        r.headers['Authorization'] = self.header
+        return r
+
+
 class SessionWithHeaderRedirection(Session):
     """A ``requests.Session`` that modifies HTTP Authorization headers in accordance
     with Earthdata Login (EDL) common usage.
@@ -57,14 +115,34 @@ class SessionWithHeaderRedirection(Session):
 
     Args:
         auth: A tuple of the form ('edl_username', 'edl_password')
+        token: An EDL bearer token
+        pool_size: Number of connections to keep alive per host. Should be at least the
+          number of threads sharing the session so connections are reused rather than
+          discarded when the pool is full. Never smaller than the ``requests`` default.
+          When given, the mounted adapters also retry idempotent requests (e.g. GET) up to
+          3 times, with exponential backoff, on 502, 503 and 504 responses. This stacks with
+          any retries made by the caller: ``Client``'s result-page polling retries each page
+          up to ``GET_JSON_RETRY_LIMIT`` times, so one page may take up to
+          4 * ``GET_JSON_RETRY_LIMIT`` HTTP requests.
     """
 
-    def __init__(self, auth: Optional[Tuple[str, str]] = None, token: str = None) -> None:
+    def __init__(self,
+                 auth: Optional[Tuple[str, str]] = None,
+                 token: str = None,
+                 pool_size: int = None) -> None:
         super().__init__()
+        if pool_size:
+            pool_size = max(pool_size, DEFAULT_POOLSIZE)
+            retries = Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+                            raise_on_status=False)
+            for prefix in ('https://', 'http://'):
+                self.mount(prefix, HTTPAdapter(pool_connections=pool_size,
+                                               pool_maxsize=pool_size,
+                                               max_retries=retries))
         if token:
             self.headers.update({'Authorization': f'Bearer {token}'})
         elif auth:
-            self.auth = auth
+            self.auth = PrecomputedBasicAuth(*auth)
         else:
             self.auth = None
 
@@ -82,13 +160,18 @@ class SessionWithHeaderRedirection(Session):
         """
 
         headers = prepared_request.headers
-        redirect_hostname = cast(str, urlparse(prepared_request.url).hostname)
-        original_hostname = cast(str, urlparse(response.request.url).hostname)
+        redirect_url = prepared_request.url
+        original_url = response.request.url
 
+        # Redirects within the same scheme://host prefix keep the header without parsing
         if ('Authorization' in headers
-                and (original_hostname != redirect_hostname)
-                and not _is_edl_hostname(redirect_hostname)):
-            del headers['Authorization']
+                and _scheme_host_prefix(original_url) != _scheme_host_prefix(redirect_url)):
+            redirect_hostname = cast(str, _hostname(redirect_url))
+            original_hostname = cast(str, _hostname(original_url))
+
+            if (original_hostname != redirect_hostname
+                    and not _is_edl_hostname(redirect_hostname)):
+                del headers['Authorization']
 
         if self.auth is None:
             # .netrc might have more auth for us on our new host.
@@ -122,29 +205,38 @@ def create_session(config: Config, auth: Tuple[str, str] = None, token: str = No
     """
     edl_username = config.EDL_USERNAME
     edl_password = config.EDL_PASSWORD
+    pool_size = config.num_requests_workers
 
     if token:
-        session = SessionWithHeaderRedirection(token=token)
+        session = SessionWithHeaderRedirection(token=token, pool_size=pool_size)
     elif isinstance(auth, tuple) and len(auth) == 2 and all([isinstance(x, str) for x in auth]):
-        session = SessionWithHeaderRedirection(auth=auth)
+        session = SessionWithHeaderRedirection(auth=auth, pool_size=pool_size)
     elif auth is not None:
         raise MalformedCredentials('Authentication: `auth` argument requires tuple of '
                                    '(username, password).')
     elif edl_username and edl_password:
-        session = SessionWithHeaderRedirection(auth=(edl_username, edl_password))
+        session = SessionWithHeaderRedirection(auth=(edl_username, edl_password),
+                                               pool_size=pool_size)
     else:
-        session = SessionWithHeaderRedirection()
+        session = SessionWithHeaderRedirection(pool_size=pool_size)
 
     return session
 
 
 def validate_auth(config: Config, session: Session):
-    """Validates the credentials against the EDL authentication URL."""
+    """Validates the credentials against the EDL authentication URL.
+
+    A session is only validated once; subsequent calls with the same session return
+    without issuing another request.
+    """
+    if session in _validated_sessions:
+        return
     if session.headers.get('Authorization') is None:
         url = config.edl_validation_url
         response = session.get(url)
 
         if response.status_code == 200:
+            _validated_sessions.add(session)
             return
         elif response.status_code == 401:
             raise BadAuthentication('Authentication: incorrect or missing credentials during '
@@ -152,3 +244,32 @@ def validate_auth(config: Config, session: Session):
         else:
             raise BadAuthentication(f'Authentication: An unknown error occurred during credential '
                                     f'validation: HTTP {response.status_code}')
+
+
+def validate_auth_lazily(session: Session):
+    """Validates the credentials using the first response the session receives, instead of
+    issuing a separate request to the EDL authentication URL.
+
+    A response hook is installed on the session that raises ``BadAuthentication`` if the
+    first (non-redirect) response is a 401. The hook removes itself after that response.
+
+    Note: since the check runs in the response hook, bad credentials are not reported when
+    the Client is created; ``BadAuthentication`` is raised by the caller's first request
+    (e.g. ``submit`` or ``status``).
+    """
+    if session in _validated_sessions or session.headers.get('Authorization') is not None:
+        return
+
+    def check_first_response(response: Response, *args, **kwargs) -> None:
+        if response.is_redirect:
+            return
+        try:
+            session.hooks['response'].remove(check_first_response)
+        except ValueError:
+            pass  # already removed by a concurrent response
+        if response.status_code == 401:
+            raise BadAuthentication('Authentication: incorrect or missing credentials during '
+                                    'credential validation.')
+        _validated_sessions.add(session)
+
+    session.hooks['response'].append(check_first_response)
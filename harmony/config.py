@@ -11,7 +11,8 @@ the ``harmony.Client``.
 """
 import os
 from enum import Enum
-from typing import cast
+from functools import lru_cache, wraps
+from typing import Callable, Optional
 
 from dotenv import load_dotenv
 
@@ -25,6 +26,27 @@ HOSTNAMES = {
 }
 
 
+@lru_cache(maxsize=None)
+def _load_dotenv() -> bool:
+    """Loads variables from a .env file into the environment. Only the first call searches
+    for and reads the file; later calls return the cached result.
+    """
+    return load_dotenv()
+
+
+def _env_overridable(getter: Callable[['Config'], str]) -> property:
+    """Makes a read-only property that an environment (or .env) variable with the
+    property's upper-cased name overrides, e.g. ``ROOT_URL`` for ``root_url``.
+    """
+    name = getter.__name__.upper()
+
+    @wraps(getter)
+    def get(self) -> str:
+        value = os.getenv(name)
+        return getter(self) if value is None else value
+    return property(get)
+
+
 class Config:
     """Runtime configuration variables including defaults and environment vars.
 
@@ -34,6 +56,10 @@ class Config:
       >>> cfg.foo
       'bar'
 
+    The built-in variables in ``config`` are read once, when the Config is created, so
+    later changes to ``os.environ`` are not seen by them; any other name is looked up in
+    the environment on each access. Attributes cannot be set on a Config instance.
+
     Parameters:
         None
     """
@@ -43,59 +69,82 @@ class Config:
         'DOWNLOAD_CHUNK_SIZE': str(4 * 1024 * 1024)  # recommend 16MB for servers
     }
 
+    # Attributes are fixed; any other name is resolved from the environment by __getattr__
+    __slots__ = (*config, '_num_requests_workers', '_download_chunk_size',
+                 'environment', 'localhost_port')
+
     def __init__(self,
                  environment: Environment = Environment.PROD,
                  localhost_port: int = 3000) -> None:
-        """Creates a new Config instance for the specified Environment."""
-        load_dotenv()
+        """Creates a new Config instance for the specified Environment.
+
+        The built-in configuration variables are read from the environment (and .env file)
+        once, here, falling back to their defaults.
+        """
+        _load_dotenv()
         for k, v in Config.config.items():
-            setattr(self, k, v)
+            setattr(self, k, os.getenv(k, v))
+        self._num_requests_workers = None
+        self._download_chunk_size = None
         self.environment = environment
         self.localhost_port = localhost_port
 
     @property
+    def num_requests_workers(self) -> int:
+        """Returns NUM_REQUESTS_WORKERS as an int, converted once and cached."""
+        if self._num_requests_workers is None:
+            self._num_requests_workers = int(self.NUM_REQUESTS_WORKERS)
+        return self._num_requests_workers
+
+    @property
+    def download_chunk_size(self) -> int:
+        """Returns DOWNLOAD_CHUNK_SIZE (in bytes) as an int, converted once and cached."""
+        if self._download_chunk_size is None:
+            self._download_chunk_size = int(self.DOWNLOAD_CHUNK_SIZE)
+        return self._download_chunk_size
+
+    @_env_overridable
     def harmony_hostname(self):
         """Returns the hostname for this Config object's Environment."""
         return HOSTNAMES[self.environment]
 
-    @property
+    @_env_overridable
     def url_scheme(self) -> str:
         return 'http' if self.environment == Environment.LOCAL else 'https'
 
-    @property
+    @_env_overridable
     def root_url(self) -> str:
         if self.environment == Environment.LOCAL:
             return f'{self.url_scheme}://{self.harmony_hostname}:{self.localhost_port}'
         else:
             return f'{self.url_scheme}://{self.harmony_hostname}'
 
-    @property
+    @_env_overridable
     def edl_validation_url(self):
         """Returns the full URL to a Harmony endpoint used to validate the
         user's Earthdata Login credentials for this Config's Environment.
         """
         return f'{self.root_url}/jobs'
 
-    def __getattribute__(self, name: str) -> str:
-        """Overrides attribute retrieval for instances of this class.
+    def __getattr__(self, name: str) -> Optional[str]:
+        """Looks up attributes that are not set on this object.
 
-        Attribute lookup follow this order:
+        Built-in configuration variables and this object's own attributes are found by
+        normal attribute lookup; the URL properties (``harmony_hostname``, ``url_scheme``,
+        ``root_url`` and ``edl_validation_url``) can still be overridden by environment
+        variables of the same upper-cased name. Any other name is looked up, in order, in:
             1. .env file variables
             2. OS environment variables
-            3. object attributes that match ``name``
 
         This dunder method is not called directly.
 
         Args:
-            name: An EDL username.
+            name: The name of the configuration variable, e.g. ``EDL_USERNAME``.
 
         Returns:
-            The value of the referenced attribute
+            The value of the environment variable, or None if it is not set
         """
-        var = os.getenv(name.upper())
-        if var is None:
-            try:
-                var = object.__getattribute__(self, name)
-            except AttributeError:
-                var = None
-        return cast(str, var)
+        if name.startswith('__') and name.endswith('__'):
+            raise AttributeError(name)
+        _load_dotenv()
+        return os.getenv(name.upper())
@@ -23,6 +23,7 @@ from http.client import ResponseNotReady
 import os
 import shutil
 import sys
+import threading
 from tabnanny import check
 import time
 import platform
@@ -34,8 +35,9 @@ from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from datetime import date, datetime
 from enum import Enum
+from functools import lru_cache
 from typing import Any, ContextManager, IO, Iterator, List, Mapping, NamedTuple, Optional, \
-    Tuple, Generator, Union
+    Tuple, Generator, TYPE_CHECKING, Union
 from urllib import parse
 
 import curlify
@@ -44,10 +46,13 @@ import progressbar
 from shapely.wkt import loads
 from shapely.lib import ShapelyError
 
-from harmony.auth import create_session, validate_auth
+from harmony.auth import create_session, validate_auth, validate_auth_lazily
 from harmony.config import Config, Environment
 from harmony import __version__ as harmony_version
 
+if TYPE_CHECKING:
+    import numpy
+
 DEFAULT_JOB_LABEL = "harmony-py"
 
 progressbar_widgets = [
@@ -57,7 +62,11 @@ progressbar_widgets = [
 ]
 
 
+@lru_cache(maxsize=128)
 def is_wkt_valid(wkt_string: str) -> bool:
+    """Returns whether the WKT string can be parsed. Cached, since a request is typically
+    validated more than once (e.g. by ``is_valid`` and again on submission).
+    """
     try:
         # Attempt to load the WKT string
         loads(wkt_string)
@@ -68,6 +77,24 @@ def is_wkt_valid(wkt_string: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=128)
+def _wkt_to_edr_route(wkt_string: str) -> str:
+    """Returns the EDR route for the given WKT string. Cached, since parsing the WKT is
+    the most expensive part of building a request URL and requests are often resubmitted.
+    """
+    # Load the WKT string into a Shapely geometry object
+    geometry = loads(wkt_string)
+
+    if geometry.geom_type == 'Polygon' or geometry.geom_type == 'MultiPolygon':
+        return 'area'
+    elif geometry.geom_type == 'Point' or geometry.geom_type == 'MultiPoint':
+        return 'position'
+    elif geometry.geom_type == 'LineString' or geometry.geom_type == 'MultiLineString':
+        return 'trajectory'
+    else:
+        raise Exception(f"Unsupported geometry type: {geometry.geom_type}")
+
+
 def temporal_to_edr_datetime(temporal: dict) -> str:
     datetime_format = '%Y-%m-%dT%H:%M:%SZ'
 
@@ -100,6 +127,8 @@ class ProcessingFailedException(Exception):
 class Collection:
     """The identity of a CMR Collection."""
 
+    __slots__ = ('id',)
+
     def __init__(self, id: str):
         """Constructs a Collection instance from a CMR Collection ID.
 
@@ -172,6 +201,8 @@ class WKT:
         spatial=WKT('MULTILINESTRING((-155.75 19.26, -155.3 19.94),(10 1, 10 30))')
     """
 
+    __slots__ = ('wkt',)
+
     def __init__(self, wkt: str):
         """Constructs a WKT instance of spatial area.
 
@@ -218,6 +249,8 @@ class Dimension:
     min: float
     max: float
 
+    __slots__ = ('name', 'min', 'max')
+
     def __init__(self, name: str, min: float = None, max: float = None):
         self.name = name
         self.min = min
@@ -259,7 +292,7 @@ class BaseRequest:
 
     def is_valid(self) -> bool:
         """Determines if the request and its parameters are valid."""
-        return len(self.error_messages()) == 0
+        return not self.error_messages()
 
     def parameter_values(self) -> List[Tuple[str, Any]]:
         """Returns tuples of each query parameter that has been set and its value."""
@@ -408,9 +441,6 @@ class Request(BaseRequest):
                 'variables': 'parameter-name',
                 'labels': 'label',
             }
-            self.spatial_validations = [
-                (lambda s: is_wkt_valid(s.wkt), f'WKT {spatial.wkt} is invalid'),
-            ]
         else:
             self.variable_name_to_query_param = {
                 'crs': 'outputcrs',
@@ -434,41 +464,6 @@ class Request(BaseRequest):
                 'labels': 'label',
             }
 
-            self.spatial_validations = [
-                (lambda bb: bb.s <= bb.n, ('Southern latitude must be less than '
-                                           'or equal to Northern latitude')),
-                (lambda bb: bb.s >= -90.0, 'Southern latitude must be greater than -90.0'),
-                (lambda bb: bb.n >= -90.0, 'Northern latitude must be greater than -90.0'),
-                (lambda bb: bb.s <= 90.0, 'Southern latitude must be less than 90.0'),
-                (lambda bb: bb.n <= 90.0, 'Northern latitude must be less than 90.0'),
-                (lambda bb: bb.w >= -180.0, 'Western longitude must be greater than -180.0'),
-                (lambda bb: bb.e >= -180.0, 'Eastern longitude must be greater than -180.0'),
-                (lambda bb: bb.w <= 180.0, 'Western longitude must be less than 180.0'),
-                (lambda bb: bb.e <= 180.0, 'Eastern longitude must be less than 180.0'),
-            ]
-
-        self.temporal_validations = [
-            (lambda tr: 'start' in tr or 'stop' in tr,
-             ('When included in the request, the temporal range should include a '
-              'start or stop attribute.')),
-            (lambda tr: tr['start'] < tr['stop'] if 'start' in tr and 'stop' in tr else True,
-             'The temporal range\'s start must be earlier than its stop datetime.')
-        ]
-        self.shape_validations = [
-            (lambda s: os.path.isfile(s), 'The provided shape path is not a file'),
-            (lambda s: s.split('.').pop().lower() in _shapefile_exts_to_mimes,
-             'The provided shape file is not a recognized type.  Valid file extensions: '
-             + f'[{_valid_shapefile_exts}]'),
-        ]
-        self.dimension_validations = [
-            (lambda dim: dim.min is None or dim.max is None or dim.min <= dim.max,
-             ('Dimension minimum value must be less than or equal to the maximum value'))
-        ]
-        self.parameter_validations = [  # for simple, one-off validations
-            (True if self.destination_url is None else self.destination_url.startswith('s3://'),
-             ('Destination URL must be an S3 location'))
-        ]
-
     def _shape_error_messages(self, shape) -> List[str]:
         """Returns a list of error message for the provided shape."""
         if not shape:
@@ -488,24 +483,99 @@ class Request(BaseRequest):
         i.e. Spatial is WKT."""
         return isinstance(self.spatial, WKT)
 
+    def _spatial_error_messages(self) -> List[str]:
+        """Returns a list of error messages for the request's spatial constraint."""
+        spatial = self.spatial
+        if not spatial:
+            return []
+        if isinstance(spatial, WKT):
+            return [] if is_wkt_valid(spatial.wkt) else [f'WKT {spatial.wkt} is invalid']
+
+        # Comparisons are negated (rather than inverted) so that NaN bounds are invalid
+        w, s, e, n = spatial
+        msgs = []
+        if not s <= n:
+            msgs.append('Southern latitude must be less than or equal to Northern latitude')
+        if not s >= -90.0:
+            msgs.append('Southern latitude must be greater than -90.0')
+        if not n >= -90.0:
+            msgs.append('Northern latitude must be greater than -90.0')
+        if not s <= 90.0:
+            msgs.append('Southern latitude must be less than 90.0')
+        if not n <= 90.0:
+            msgs.append('Northern latitude must be less than 90.0')
+        if not w >= -180.0:
+            msgs.append('Western longitude must be greater than -180.0')
+        if not e >= -180.0:
+            msgs.append('Eastern longitude must be greater than -180.0')
+        if not w <= 180.0:
+            msgs.append('Western longitude must be less than 180.0')
+        if not e <= 180.0:
+            msgs.append('Eastern longitude must be less than 180.0')
+        return msgs
+
+    def _temporal_error_messages(self) -> List[str]:
+        """Returns a list of error messages for the request's temporal range."""
+        temporal = self.temporal
+        if not temporal:
+            return []
+        has_start = 'start' in temporal
+        has_stop = 'stop' in temporal
+        if not (has_start or has_stop):
+            return ['When included in the request, the temporal range should include a '
+                    'start or stop attribute.']
+        if has_start and has_stop and not temporal['start'] < temporal['stop']:
+            return ['The temporal range\'s start must be earlier than its stop datetime.']
+        return []
+
+    def _dimension_error_messages(self) -> List[str]:
+        """Returns a list of error messages, one per invalid dimension."""
+        return ['Dimension minimum value must be less than or equal to the maximum value'
+                for dim in self.dimensions or []
+                if not (dim.min is None or dim.max is None or dim.min <= dim.max)]
+
     def error_messages(self) -> List[str]:
         """A list of error messages, if any, for the request."""
-        spatial_msgs = []
-        temporal_msgs = []
-        dimension_msgs = []
-        parameter_msgs = [m for v, m in self.parameter_validations if not v]
-        shape_msgs = self._shape_error_messages(self.shape)
-        if self.spatial:
-            spatial_msgs = [m for v, m in self.spatial_validations if not v(self.spatial)]
-        if self.temporal:
-            temporal_msgs = [m for v, m in self.temporal_validations if not v(self.temporal)]
-        if self.dimensions:
-            for dim in self.dimensions:
-                msgs = [m for v, m in self.dimension_validations if not v(dim)]
-                if msgs:
-                    dimension_msgs += msgs
-
-        return spatial_msgs + temporal_msgs + shape_msgs + dimension_msgs + parameter_msgs
+        msgs = self._spatial_error_messages()
+        msgs += self._temporal_error_messages()
+        msgs += self._shape_error_messages(self.shape)
+        msgs += self._dimension_error_messages()
+        if self.destination_url is not None and not self.destination_url.startswith('s3://'):
+            msgs.append('Destination URL must be an S3 location')
+        return msgs
+
+    @staticmethod
+    def validate_bboxes(bboxes) -> "numpy.ndarray":
+        """Determines which of many bounding boxes are valid spatial constraints, using
+        vectorized NumPy comparisons rather than validating one Request at a time.
+
+        Example::
+
+            >>> Request.validate_bboxes([BBox(-130, 30, -100, 60), BBox(10, -10, 20, -20)])
+            array([ True, False])
+
+        Args:
+            bboxes: A sequence of BBoxes, or an array-like of shape (N, 4) whose rows are
+              (west, south, east, north)
+
+        Returns:
+            A boolean NumPy array, True for each bounding box that would pass validation
+
+        :raises
+            ImportError: if NumPy is not installed
+            ValueError: if bboxes is not a sequence of 4-element bounding boxes
+        """
+        import numpy as np
+
+        arr = np.asarray(bboxes, dtype=float)
+        if arr.size == 0:
+            arr = arr.reshape(0, 4)
+        if not (arr.ndim == 2 and arr.shape[1] == 4):
+            raise ValueError(f'Bounding boxes must have shape (N, 4), not {arr.shape}')
+        w, s, e, n = arr.T
+        # NaN compares False, so NaN bounds are invalid just as in _spatial_error_messages
+        return ((s <= n) & (s >= -90.0) & (n >= -90.0) & (s <= 90.0) & (n <= 90.0)
+                & (w >= -180.0) & (e >= -180.0) & (w <= 180.0) & (e <= 180.0))
 
 
 class CapabilitiesRequest(BaseRequest):
@@ -585,7 +655,15 @@ class Client:
         >>> client = Client(token='myEDLTokenValue')
 
     By default, the Client will validate the provided credentials immediately. This can be
-    disabled by passing ``should_validate_auth=False``.
+    disabled by passing ``should_validate_auth=False``, or deferred to the first request the
+    Client makes (saving a round trip) by passing ``should_validate_auth='lazy'``.
+
+    The Client keeps a single HTTP session (and its pool of keep-alive connections) for
+    all of its requests. Use it as a context manager, or call ``close()``, to release the
+    session and the download thread pool when done::
+
+        >>> with Client() as client:
+        ...     job_id = client.submit(request)
     """
 
     zarr_download_exception_msg = 'The zarr library must be used for zarr files. '\
@@ -597,7 +675,7 @@ class Client:
         self,
         *,
         auth: Optional[Tuple[str, str]] = None,
-        should_validate_auth: bool = True,
+        should_validate_auth: Union[bool, str] = True,
         env: Environment = Environment.PROD,
         token: str = None,
         # How often to poll Harmony for updated information during job processing
@@ -607,27 +685,67 @@ class Client:
 
         Args:
             auth : A tuple of the format ('edl_username', 'edl_password')
-            should_validate_auth: Whether EDL credentials will be validated.
+            should_validate_auth: Whether EDL credentials will be validated: True, False or
+              'lazy'. If 'lazy', they are validated by the first request made rather than by a
+              separate request.
+
+        :raises
+            ValueError: if should_validate_auth is not True, False or 'lazy'
         """
+        if should_validate_auth not in (True, False, 'lazy'):
+            raise ValueError("should_validate_auth must be True, False or 'lazy', "
+                             f"not {should_validate_auth!r}")
         self.config = Config(env)
         self.session = None
+        self._session_lock = threading.Lock()
+        self._closed = False
         self.auth = auth
         self.token = token
         self.check_interval = check_interval
 
-        num_workers = int(self.config.NUM_REQUESTS_WORKERS)
+        num_workers = self.config.num_requests_workers
         self.executor = ThreadPoolExecutor(max_workers=num_workers)
 
-        if should_validate_auth:
+        if should_validate_auth == 'lazy':
+            validate_auth_lazily(self._session())
+        elif should_validate_auth:
             validate_auth(self.config, self._session())
 
+    def __enter__(self) -> 'Client':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the Client's HTTP session and shuts down its download thread pool,
+        waiting for any pending downloads to finish.
+
+        A closed Client cannot be used again; its methods raise a RuntimeError.
+        """
+        self._closed = True
+        self.executor.shutdown(wait=True)
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+
+    def _check_open(self) -> None:
+        """Raises a RuntimeError if the Client has been closed."""
+        if self._closed:
+            raise RuntimeError('This Client has been closed and can no longer be used')
+
     def _session(self):
-        """Creates (if needed) and returns the Client's requests Session."""
+        """Creates (if needed) and returns the Client's requests Session. Safe to call from
+        the Client's worker threads: only one Session is ever created.
+        """
+        self._check_open()
         if self.session is None:
-            if self.token:
-                self.session = create_session(self.config, token=self.token)
-            else:
-                self.session = create_session(self.config, auth=self.auth)
+            with self._session_lock:
+                if self.session is None:
+                    if self.token:
+                        self.session = create_session(self.config, token=self.token)
+                    else:
+                        self.session = create_session(self.config, auth=self.auth)
         return self.session
 
     def _http_method(self, request: BaseRequest) -> str:
@@ -637,17 +755,7 @@ class Client:
 
     def _wkt_to_edr_route(self, wkt_string: str) -> str:
         """Returns the EDR route for the given WKT string."""
-        # Load the WKT string into a Shapely geometry object
-        geometry = loads(wkt_string)
-
-        if geometry.geom_type == 'Polygon' or geometry.geom_type == 'MultiPolygon':
-            return 'area'
-        elif geometry.geom_type == 'Point' or geometry.geom_type == 'MultiPoint':
-            return 'position'
-        elif geometry.geom_type == 'LineString' or geometry.geom_type == 'MultiLineString':
-            return 'trajectory'
-        else:
-            raise Exception(f"Unsupported geometry type: {geometry.geom_type}")
+        return _wkt_to_edr_route(wkt_string)
 
     def _submit_url(self, request: BaseRequest) -> str:
         """Constructs the URL for the request that is used to submit a new Harmony Job."""
@@ -706,9 +814,8 @@ class Client:
                 if len(subset) > 0:
                     params['subset'] = subset
             if (os.getenv('EXCLUDE_DEFAULT_LABEL') != 'true'):
-                labels = request.labels or []
-                labels.append(DEFAULT_JOB_LABEL)
-                params['label'] = labels
+                # Copy so the request's own labels aren't extended on every submit
+                params['label'] = [*(request.labels or []), DEFAULT_JOB_LABEL]
                 skipped_params.append('label')
 
         query_params = [pv for pv in request.parameter_values() if pv[0] not in skipped_params]
@@ -978,10 +1085,18 @@ class Client:
             The JSON response for direct download request
             The capabilities response for capabilities request
         """
-        if not request.is_valid():
-            msgs = ', '.join(request.error_messages())
+        self._validate_request(request)
+        return self._submit_validated(request)
+
+    def _validate_request(self, request: BaseRequest) -> None:
+        """Raises an Exception listing the request's errors if it is not valid."""
+        errors = request.error_messages()
+        if errors:
+            msgs = ', '.join(errors)
             raise Exception(f"Cannot submit the request due to the following errors: [{msgs}]")
 
+    def _submit_validated(self, request: BaseRequest) -> any:
+        """Submits an already validated request to Harmony; see ``submit``."""
         session = self._session()
 
         response = session.send(self._get_prepared_request(request))
@@ -996,6 +1111,32 @@ class Client:
         else:
             self._handle_error_response(response)
 
+    def submit_all(self, requests: List[BaseRequest]) -> List[Any]:
+        """Submits several requests to Harmony concurrently.
+
+        The requests are sent in parallel over the Client's shared session using its thread
+        pool (sized by the NUM_REQUESTS_WORKERS environment variable). All requests are
+        validated before any of them are sent.
+
+        Note: this is the same thread pool that downloads result files, so submissions
+        queue behind (and then share worker threads with) any downloads still pending.
+
+        Args:
+            requests: The Requests to submit to Harmony
+
+        Returns:
+            A list with the result of ``submit`` for each request, in the same order as the
+            given requests
+
+        :raises
+            Exception: if any request is invalid or any submission fails
+        """
+        self._check_open()
+        for request in requests:
+            self._validate_request(request)
+
+        return list(self.executor.map(self._submit_validated, requests))
+
     def status(self, job_id: str) -> dict:
         """Retrieve a submitted job's metadata from Harmony.
 
@@ -1317,7 +1458,6 @@ class Client:
         Returns:
             The filename and path.
         """
-        chunksize = int(self.config.DOWNLOAD_CHUNK_SIZE)
         session = self._session()
         filename = self.get_download_filename_from_url(url)
         new_url = url
@@ -1343,12 +1483,16 @@ class Client:
             }
             with getattr(session, method)(
                     new_url, data=data_dict, stream=True, headers=headers) as r:
-                with open(filename, 'wb') as f:
-                    shutil.copyfileobj(r.raw, f, length=chunksize)
+                self._write_bytes(filename, r.raw)
             if verbose and verbose.upper() == 'TRUE':
                 print(filename)
             return filename
 
+    def _write_bytes(self, filename: str, stream: IO[bytes]) -> None:
+        """Writes a binary stream to a file, copying it in DOWNLOAD_CHUNK_SIZE chunks."""
+        with open(filename, 'wb') as f:
+            shutil.copyfileobj(stream, f, length=self.config.download_chunk_size)
+
     def download(self, url: str, directory: str = '', overwrite: bool = False) -> Future:
         """Downloads data and saves it to a file asynchronously.
 
@@ -1365,6 +1509,7 @@ class Client:
         """
         if url.endswith('zarr'):
             raise self.zarr_download_exception
+        self._check_open()
         future = self.executor.submit(self._download_file, url, directory, overwrite)
         return future
 
@@ -1401,6 +1546,7 @@ class Client:
             A list of Futures, each of which will return the filename (with path) for each
             result.
         """
+        self._check_open()
         if isinstance(job_id_or_result_json, str):
             for url in self.result_urls(job_id_or_result_json, show_progress=False) or []:
                 if url.endswith('zarr'):
@@ -1462,6 +1608,9 @@ class Client:
         Returns:
             An Iterator that can be used to iterate over the granule results from a job
         """
+        # Each attempt is itself retried by the session's adapter on 502/503/504 (see
+        # SessionWithHeaderRedirection), so a page may take up to 4 * GET_JSON_RETRY_LIMIT
+        # requests, and GET_JSON_RETRY_SLEEP only spaces out these outer attempts.
         GET_JSON_RETRY_LIMIT = int(os.getenv('GET_JSON_RETRY_LIMIT', 3))
         GET_JSON_RETRY_SLEEP = float(os.getenv('GET_JSON_RETRY_SLEEP', 1.0))
         next_url = self._status_url(job_id)
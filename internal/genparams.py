@@ -1,34 +1,43 @@
+from functools import lru_cache
+import os
 import sys
 
 from camel_case_switcher import camel_case_to_underscore
 import yaml
 
+try:
+    from yaml import CSafeLoader as SchemaLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as SchemaLoader
 
-def canonical_name(yaml_param):
-    name_map = {
-        'outputcrs': 'crs'
-    }
+NAME_MAP = {
+    'outputcrs': 'crs'
+}
+
+TYPE_MAP = {
+    'string': 'str',
+    'boolean': 'bool',
+    'integer': 'int',
+    'number': 'float'
+}
+
+_to_snake = lru_cache(maxsize=None)(camel_case_to_underscore)
 
+
+def canonical_name(yaml_param):
     print(yaml_param)
     name = yaml_param['name']
-    return name_map.get(name, camel_case_to_underscore(name))
+    return NAME_MAP.get(name) or _to_snake(name)
 
 
 def canonical_type(yaml_param):
-    type_map = {
-        'string': 'str',
-        'boolean': 'bool',
-        'integer': 'int',
-        'number': 'float'
-    }
-
     py_type = None
     yaml_type = yaml_param['schema']['type']
     if yaml_type == 'array':
-        item_type = type_map[yaml_param['schema']['items']['type']]
+        item_type = TYPE_MAP[yaml_param['schema']['items']['type']]
         py_type = f"list[{item_type}]"
     else:
-        py_type = type_map[yaml_type]
+        py_type = TYPE_MAP[yaml_type]
 
     return py_type
 
@@ -39,29 +48,33 @@ def param_docstring(yaml_param):
     return f'{name}: {descr}'
 
 
-def main(schema_filename: str):
+@lru_cache(maxsize=None)
+def _load_schema(schema_filename: str, mtime: float):
+    # mtime is part of the cache key so an edited schema is re-parsed
     with open(schema_filename, 'r') as schema:
-        api = yaml.load(schema, Loader=yaml.Loader)
-
-        do_not_generate = ['collectionId', 'subset']
-
-        params = api['paths']['/collections/{collectionId}/coverage/rangeset']['get']['parameters']
-        refs = [p.get('$ref').split('/')[-1] for p in params]
-        param_types = [api['components']['parameters'][r] for
-                       r in refs if r not in do_not_generate]
-
-        params = [f'{canonical_name(pt)}: {canonical_type(pt)}' for pt in param_types]
-        param_docstrings = [param_docstring(pt) for pt in param_types]
-
-        print("def __init__(self, *, " + ", ".join(params) + "):")
-        print('    """')
-        print('    Parameters:')
-        print('    -----------')
-        for pds in param_docstrings:
-            print('    ' + pds)
-            print()
-        print()
-        print('    """')
+        return yaml.load(schema, Loader=SchemaLoader)
+
+
+def main(schema_filename: str):
+    api = _load_schema(schema_filename, os.path.getmtime(schema_filename))
+    do_not_generate = ['collectionId', 'subset']
+
+    params = api['paths']['/collections/{collectionId}/coverage/rangeset']['get']['parameters']
+    refs = [p.get('$ref').split('/')[-1] for p in params]
+    param_types = [api['components']['parameters'][r] for
+                   r in refs if r not in do_not_generate]
+
+    params = [f'{canonical_name(pt)}: {canonical_type(pt)}' for pt in param_types]
+    param_docstrings = [param_docstring(pt) for pt in param_types]
+
+    out = ["def __init__(self, *, " + ", ".join(params) + "):",
+           '    """',
+           '    Parameters:',
+           '    -----------']
+    out.extend('    ' + pds + '\n' for pds in param_docstrings)
+    out.append('')
+    out.append('    """')
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,12 @@
+import os
+
+from hypothesis import settings
+
+# Select with HYPOTHESIS_PROFILE; CI sets it to 'ci'. The properties are cheap, so there is
+# no deadline: a slow runner or a GC pause shouldn't fail an example.
+settings.register_profile('dev', max_examples=50, deadline=None)
+# CI runs under pytest-xdist; without a database, workers don't share .hypothesis/
+settings.register_profile('ci', max_examples=25, derandomize=True, deadline=None,
+                          database=None)
+settings.register_profile('nightly', max_examples=1000, deadline=None)
+settings.load_profile(os.getenv('HYPOTHESIS_PROFILE', 'dev'))
@@ -1,10 +1,21 @@
 import pytest
+from requests import Request, Response
 import responses
 
-from harmony.auth import (_is_edl_hostname, create_session, validate_auth,
-                          BadAuthentication, MalformedCredentials, SessionWithHeaderRedirection)
+from harmony.auth import (_hostname, _is_edl_hostname, _scheme_host_prefix, create_session,
+                          validate_auth, validate_auth_lazily, BadAuthentication,
+                          MalformedCredentials, PrecomputedBasicAuth, SessionWithHeaderRedirection)
 from harmony.config import Config
 
+EDL_HOSTS = (
+    ('uat.urs.earthdata.nasa.gov', True),
+    ('urs.earthdata.nasa.gov', True),
+    ('URS.Earthdata.NASA.gov', True),
+    ('example.gov', False),
+    ('earthdata.nasa.gov', False),
+    ('urs.earthdata.nasa.gov.badactor.com', False)
+)
+
 
 class Object(object):
     pass
@@ -19,21 +30,52 @@ def test_authentication_no_args_no_validate():
     fake_config = Object()
     fake_config.EDL_USERNAME = None
     fake_config.EDL_PASSWORD = None
+    fake_config.num_requests_workers = 3
     session = create_session(fake_config)
     assert session.auth is None
 
 
-@pytest.mark.parametrize('hostname,expected', [
-    ('uat.urs.earthdata.nasa.gov', True),
-    ('urs.earthdata.nasa.gov', True),
-    ('example.gov', False),
-    ('earthdata.nasa.gov', False),
-    ('urs.earthdata.nasa.gov.badactor.com', False)
-])
+def test_session_with_credentials_precomputes_basic_auth_header():
+    session = SessionWithHeaderRedirection(auth=('foo', 'bar'))
+    prepared = session.prepare_request(Request('GET', 'https://harmony.earthdata.nasa.gov'))
+
+    assert isinstance(session.auth, PrecomputedBasicAuth)
+    assert session.auth == PrecomputedBasicAuth('foo', 'bar')
+    assert prepared.headers['Authorization'] == 'Basic Zm9vOmJhcg=='
+
+
+def test_session_connection_pool_is_sized_to_workers():
+    session = SessionWithHeaderRedirection(pool_size=12)
+    for prefix in ('https://', 'http://'):
+        adapter = session.get_adapter(prefix)
+        assert adapter._pool_connections == 12
+        assert adapter._pool_maxsize == 12
+
+
+@pytest.mark.parametrize('hostname,expected', EDL_HOSTS)
 def test__is_edl_hostname(hostname, expected):
     assert _is_edl_hostname(hostname) is expected
 
 
+@pytest.mark.parametrize('url,expected', [
+    ('https://uat.urs.earthdata.nasa.gov/oauth/authorize?a=b', 'uat.urs.earthdata.nasa.gov'),
+    ('https://Harmony.Earthdata.nasa.gov:443/jobs', 'harmony.earthdata.nasa.gov'),
+    ('http://localhost:3000/jobs', 'localhost'),
+    ('/relative/path', None)
+])
+def test__hostname(url, expected):
+    assert _hostname(url) == expected
+
+
+@pytest.mark.parametrize('url,expected', [
+    ('https://harmony.earthdata.nasa.gov/jobs/1234', 'https://harmony.earthdata.nasa.gov'),
+    ('https://harmony.earthdata.nasa.gov', 'https://harmony.earthdata.nasa.gov'),
+    ('http://localhost:3000/', 'http://localhost:3000'),
+])
+def test__scheme_host_prefix(url, expected):
+    assert _scheme_host_prefix(url) == expected
+
+
 @pytest.mark.parametrize('auth', [
     (None,),
     ('username'),
@@ -41,7 +83,7 @@ def test__is_edl_hostname(hostname, expected):
     ('username', 333),
     (999, 'secret'),
 ])
-def test_authentication_with_malformed_auth(auth, config, mocker):
+def test_authentication_with_malformed_auth(auth, config):
     with pytest.raises(MalformedCredentials) as exc_info:
         session = create_session(config, auth=auth)
         validate_auth(config, session)
@@ -51,7 +93,7 @@ def test_authentication_with_malformed_auth(auth, config, mocker):
 @responses.activate
 @pytest.mark.parametrize('status_code,should_error',
                          [(200, False), (401, True), (500, True)])
-def test_authentication(status_code, should_error, config, mocker):
+def test_authentication(status_code, should_error, config):
     auth_url = 'https://harmony.earthdata.nasa.gov/jobs'
     responses.add(
         responses.GET,
@@ -72,39 +114,76 @@ def test_authentication(status_code, should_error, config, mocker):
         assert actual_session is not None
 
 
-def test_SessionWithHeaderRedirection_with_no_edl(mocker):
-    preparedrequest_mock = mocker.PropertyMock()
-    preparedrequest_props = {'url': 'https://www.example.gov',
-                             'headers': {'Authorization': 'lorem ipsum'}}
-    preparedrequest_mock.configure_mock(**preparedrequest_props)
+@responses.activate
+def test_validate_auth_only_validates_a_session_once(config):
+    responses.add(
+        responses.GET,
+        'https://harmony.earthdata.nasa.gov/jobs',
+        status=200
+    )
+    session = create_session(config)
+    validate_auth(config, session)
+    validate_auth(config, session)
 
-    response_mock = mocker.PropertyMock()
-    response_mock.request.configure_mock(url='https://www.othersite.gov')
+    assert len(responses.calls) == 1
 
-    mocker.patch('harmony.auth.PreparedRequest', return_value=preparedrequest_mock)
-    mocker.patch('harmony.auth.Response', return_value=response_mock)
+
+@responses.activate
+@pytest.mark.parametrize('status_code,should_error', [(200, False), (401, True)])
+def test_validate_auth_lazily(status_code, should_error, config):
+    url = 'https://harmony.earthdata.nasa.gov/jobs/abcd-1234'
+    responses.add(responses.GET, url, status=status_code)
+    responses.add(responses.GET, url, status=status_code)
+    session = create_session(config)
+    validate_auth_lazily(session)
+
+    assert len(responses.calls) == 0
+    if should_error:
+        with pytest.raises(BadAuthentication) as exc_info:
+            session.get(url)
+        assert 'Authentication: incorrect or missing credentials' in str(exc_info.value)
+    else:
+        session.get(url)
+    # Only the first response is checked
+    session.get(url)
+    assert session.hooks['response'] == []
+
+
+def redirect(original_url, redirect_url):
+    """Builds the (redirect request, response) pair ``rebuild_auth`` is called with."""
+    prepared_request = Request('GET', redirect_url,
+                               headers={'Authorization': 'lorem ipsum'}).prepare()
+    response = Response()
+    response.request = Request('GET', original_url).prepare()
+    return prepared_request, response
+
+
+def test_SessionWithHeaderRedirection_with_no_edl():
+    prepared_request, response = redirect('https://www.othersite.gov', 'https://www.example.gov')
 
     session_with_creds = SessionWithHeaderRedirection(auth=('foo', 'bar'))
-    session_with_creds.rebuild_auth(preparedrequest_mock, response_mock)
+    session_with_creds.rebuild_auth(prepared_request, response)
+
+    assert prepared_request.url == 'https://www.example.gov/' \
+           and 'Authorization' not in prepared_request.headers
 
-    assert preparedrequest_mock.url == preparedrequest_props['url'] \
-           and 'Authorization' not in preparedrequest_mock.headers
 
+def test_SessionWithHeaderRedirection_with_same_host():
+    prepared_request, response = redirect('https://www.example.gov/original',
+                                          'https://www.example.gov/redirected')
+
+    session_with_creds = SessionWithHeaderRedirection(auth=('foo', 'bar'))
+    session_with_creds.rebuild_auth(prepared_request, response)
 
-def test_SessionWithHeaderRedirection_with_edl(mocker):
-    preparedrequest_mock = mocker.PropertyMock()
-    preparedrequest_props = {'url': 'https://uat.urs.earthdata.nasa.gov',
-                             'headers': {'Authorization': 'lorem ipsum'}}
-    preparedrequest_mock.configure_mock(**preparedrequest_props)
+    assert 'Authorization' in prepared_request.headers
 
-    response_mock = mocker.PropertyMock()
-    response_mock.request.configure_mock(url='https://www.othersite.gov')
 
-    mocker.patch('harmony.auth.PreparedRequest', return_value=preparedrequest_mock)
-    mocker.patch('harmony.auth.Response', return_value=response_mock)
+def test_SessionWithHeaderRedirection_with_edl():
+    prepared_request, response = redirect('https://www.othersite.gov',
+                                          'https://uat.urs.earthdata.nasa.gov')
 
     session_with_creds = SessionWithHeaderRedirection(auth=('foo', 'bar'))
-    session_with_creds.rebuild_auth(preparedrequest_mock, response_mock)
+    session_with_creds.rebuild_auth(prepared_request, response)
 
-    assert preparedrequest_mock.url == preparedrequest_props['url'] \
-           and 'Authorization' in preparedrequest_mock.headers
+    assert prepared_request.url == 'https://uat.urs.earthdata.nasa.gov/' \
+           and 'Authorization' in prepared_request.headers
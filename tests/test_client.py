@@ -1,25 +1,102 @@
 import copy
 import datetime as dt
-import io
+from itertools import zip_longest
+import json
 import os
 import re
+import threading
 from typing import List
 import urllib.parse
 import pathlib
 
-import dateutil.parser
 import pytest
 import responses
 
+from harmony.auth import create_session
 from harmony.harmony import BBox, Client, Collection, LinkType, ProcessingFailedException, Dimension
 from harmony.harmony import Request, CapabilitiesRequest, DEFAULT_JOB_LABEL
 
+CONTENT_DISPOSITION_NAME = b'Content-Disposition: form-data; name="'
+CONTENT_DISPOSITION_FILENAME = b'; filename="'
 
-@pytest.fixture()
+
+@pytest.fixture(scope='session')
 def examples_dir():
     return pathlib.Path(__file__).parent.parent.joinpath('examples').absolute()
 
 
+@pytest.fixture(scope='session')
+def asf_example(examples_dir):
+    return str(examples_dir / 'asf_example.json')
+
+
+@pytest.fixture(scope='module')
+def client():
+    """A Client shared by the tests in this module that don't need their own."""
+    with Client(should_validate_auth=False) as client:
+        yield client
+
+
+@pytest.fixture(scope='module')
+def fast_client():
+    """A shared Client that polls job status without waiting between requests."""
+    with Client(should_validate_auth=False, check_interval=0) as client:
+        yield client
+
+
+@pytest.fixture(autouse=True)
+def sleep_calls(monkeypatch):
+    """Keeps polling loops from really sleeping. Tests can request the list of delays
+    passed to time.sleep to check the calls."""
+    sleep_calls = []
+    monkeypatch.setattr('harmony.harmony.time.sleep', sleep_calls.append)
+    return sleep_calls
+
+
+@pytest.fixture
+def progressbar_mock(mocker):
+    """Replaces the progress bar with a mock that is also its own context manager."""
+    progressbar_mock = mocker.MagicMock()
+    progressbar_mock.__enter__.return_value = progressbar_mock
+    mocker.patch('harmony.harmony.progressbar.ProgressBar', return_value=progressbar_mock)
+    return progressbar_mock
+
+
+@pytest.fixture
+def mock_submit():
+    """Returns a function that registers a successful submit response for a collection
+    and returns the job ID the response will contain.
+    """
+    def install(collection_id, job_id=DEFAULT_JOB_ID):
+        responses.add(
+            responses.POST,
+            expected_submit_url(collection_id),
+            status=200,
+            body=expected_job_body(collection_id, job_id),
+            content_type='application/json'
+        )
+        return job_id
+    return install
+
+
+@pytest.fixture
+def error_endpoints():
+    """Returns a function that registers a 500 response with the given payload for a
+    submit and for two status requests, the calls made by the error handling tests.
+    """
+    def install(collection_id, job_id, **payload):
+        status_url = expected_status_url(job_id)
+        for method, url in ((responses.POST, expected_submit_url(collection_id)),
+                            (responses.GET, status_url),
+                            (responses.GET, status_url)):
+            responses.add(method, url, status=500, **payload)
+    return install
+
+
+def called_urls():
+    """Returns the percent-decoded URL of each request recorded by responses."""
+    return [urllib.parse.unquote(call.request.url) for call in responses.calls]
+
 def expected_submit_url(collection_id, variables='all'):
     return (f'https://harmony.earthdata.nasa.gov/{collection_id}'
             f'/ogc-api-coverages/1.0.0/collections/parameter_vars/coverage/rangeset')
@@ -33,6 +110,26 @@ def expected_pause_url(job_id, link_type: LinkType = LinkType.https):
 def expected_resume_url(job_id, link_type: LinkType = LinkType.https):
     return f'https://harmony.earthdata.nasa.gov/jobs/{job_id}/resume?linktype={link_type.value}'
 
+def parse_content_disposition(data, start, stop):
+    """Returns the (name, filename) of the Content-Disposition header found in
+    data[start:stop], or None if there is none. filename is None for regular form fields.
+    """
+    name_start = data.find(CONTENT_DISPOSITION_NAME, start, stop)
+    if name_start == -1:
+        return None
+    name_start += len(CONTENT_DISPOSITION_NAME)
+    name_end = data.find(b'"', name_start, stop)
+    if name_end <= name_start:
+        return None
+
+    filename = None
+    if data.startswith(CONTENT_DISPOSITION_FILENAME, name_end + 1, stop):
+        filename_start = name_end + 1 + len(CONTENT_DISPOSITION_FILENAME)
+        filename_end = data.find(b'"', filename_start, stop)
+        if filename_end > filename_start:
+            filename = data[filename_start:filename_end].decode('utf-8')
+    return data[name_start:name_end].decode('utf-8'), filename
+
 def parse_multipart_data(request):
     """Parses multipart/form-data request to extract fields as strings."""
     body_bytes = request.body
@@ -42,104 +139,101 @@ def parse_multipart_data(request):
     boundary = content_type.split("boundary=")[1]
     boundary_bytes = ('--' + boundary).encode()
 
-    parts = body_bytes.split(boundary_bytes)
-
     form_data = {}
-    cd_regex = re.compile(rb'Content-Disposition: form-data; name="([^"]+)"(?:; filename="([^"]+)")?', re.IGNORECASE)
-
-    for part in parts:
-        if part.strip():
-            # Splitting headers and body
-            parts_split = part.split(b'\r\n\r\n', 1)
-            if len(parts_split) == 2:
-                headers, body = parts_split
-                body = body.strip(b'\r\n')
-
-                cd_match = cd_regex.search(headers)
-                if cd_match:
-                    field_name = cd_match.group(1).decode('utf-8')
-                    filename = cd_match.group(2)
-
-                    if filename:
-                        filename = filename.decode('utf-8')
-                        form_data[field_name] = {'filename': filename, 'content': body}
-                    else:  # It's a regular form field
-                        value = body.decode('utf-8').strip()
-                        if field_name in form_data:
-                            # If it's already a list, append to it
-                            if isinstance(form_data[field_name], list):
-                                form_data[field_name].append(value)
-                            else:
-                                # If it's not a list, make it a list with the old and new value
-                                form_data[field_name] = [form_data[field_name], value]
+
+    # Scan for each part in place rather than splitting the body into copies
+    body_view = memoryview(body_bytes)
+    start = body_bytes.find(boundary_bytes)
+    while start != -1:
+        start += len(boundary_bytes)
+        end = body_bytes.find(boundary_bytes, start)
+        part_end = end if end != -1 else len(body_bytes)
+
+        # Splitting headers and body
+        header_end = body_bytes.find(b'\r\n\r\n', start, part_end)
+        if header_end != -1:
+            content_disposition = parse_content_disposition(body_bytes, start, header_end)
+            if content_disposition:
+                field_name, filename = content_disposition
+                # The body runs up to the CRLF that precedes the next boundary
+                body_start = header_end + 4
+                body_end = body_bytes.rfind(b'\r\n', body_start, part_end)
+                if body_end == -1:
+                    body_end = part_end
+
+                if filename:
+                    form_data[field_name] = {'filename': filename,
+                                             'content': body_bytes[body_start:body_end]}
+                else:  # It's a regular form field
+                    value = str(body_view[body_start:body_end], 'utf-8')
+                    if field_name in form_data:
+                        # If it's already a list, append to it
+                        if isinstance(form_data[field_name], list):
+                            form_data[field_name].append(value)
                         else:
-                            # If the field doesn't exist, add it normally
-                            form_data[field_name] = value
+                            # If it's not a list, make it a list with the old and new value
+                            form_data[field_name] = [form_data[field_name], value]
+                    else:
+                        # If the field doesn't exist, add it normally
+                        form_data[field_name] = value
+        start = end
 
     return form_data
 
+def exclude_default_label():
+    """Returns True if the default job label is disabled via EXCLUDE_DEFAULT_LABEL."""
+    return os.environ.get('EXCLUDE_DEFAULT_LABEL') == 'true'
+
 def construct_expected_params(query_string):
     """Returns the expected parameters from a query string. Needed a custom function to
     handle multiple values for the same parameter name such as `subset`.
     """
-    parsed_params = urllib.parse.parse_qsl(query_string)
-    expected_params = {}
-    for key, value in parsed_params:
-        if key in expected_params:
-            # If the key already exists, and it's not a list, convert it to a list
-            if not isinstance(expected_params[key], list):
-                expected_params[key] = [expected_params[key]]
-            # Append the new value to the existing list
-            expected_params[key].append(value)
-        else:
-            # Add the key-value pair to the dictionary
-            expected_params[key] = value
-    if (os.getenv('EXCLUDE_DEFAULT_LABEL') != 'true'):
-            expected_params['label'] = DEFAULT_JOB_LABEL
+    parsed_params = urllib.parse.parse_qs(query_string)
+    expected_params = {k: v[0] if len(v) == 1 else v for k, v in parsed_params.items()}
+    if not exclude_default_label():
+        expected_params['label'] = DEFAULT_JOB_LABEL
     return expected_params
 
-def is_expected_url_and_form_encoded_body(harmony_request, http_request):
-    """Returns True if the URL and form encoded body match what is expected based
-    on the harmony request object.
-    """
-    form_data_params = parse_multipart_data(http_request)
-    async_params = ['forceAsync=true']
+def expected_form_params(harmony_request):
+    """Returns the form encoded body parameters expected for the harmony request object."""
+    query_parts = ['forceAsync=true']
 
-    spatial_params = []
     if harmony_request.spatial:
         w, s, e, n = harmony_request.spatial
-        spatial_params = [f'subset=lat({s}:{n})', f'subset=lon({w}:{e})']
+        query_parts.append(f'subset=lat({s}:{n})')
+        query_parts.append(f'subset=lon({w}:{e})')
 
-    temporal_params = []
     if harmony_request.temporal:
         start = harmony_request.temporal['start']
         stop = harmony_request.temporal['stop']
-        temporal_params = [f'subset=time("{start.isoformat()}":"{stop.isoformat()}")']
+        query_parts.append(f'subset=time("{start.isoformat()}":"{stop.isoformat()}")')
 
-    dimension_params = []
     if harmony_request.dimensions:
         for dim in harmony_request.dimensions:
             name = dim.name
             min = dim.min if dim.min is not None else '*'
             max = dim.max if dim.max is not None else '*'
-            dimension_params += [f'subset={name}({min}:{max})']
+            query_parts.append(f'subset={name}({min}:{max})')
 
-    variable_params = ['variable=all']
-
-    query_params = '&'.join(async_params + spatial_params + temporal_params + dimension_params + variable_params)
+    query_parts.append('variable=all')
     if harmony_request.format is not None:
-        query_params += f'&format{harmony_request.format}'
+        query_parts.append(f'format={harmony_request.format}')
     if harmony_request.skip_preview is not None:
-        query_params += f'&skipPreview={str(harmony_request.skip_preview).lower()}'
+        query_parts.append(f'skipPreview={str(harmony_request.skip_preview).lower()}')
 
-    expected_params = construct_expected_params(query_params)
+    return construct_expected_params('&'.join(query_parts))
 
-    return form_data_params == expected_params and http_request.url ==  expected_submit_url(harmony_request.collection.id)
+def is_expected_url_and_form_encoded_body(harmony_request, *http_requests):
+    """Returns True if the URL and form encoded body of each HTTP request match what is
+    expected based on the harmony request object.
+    """
+    expected_url = expected_submit_url(harmony_request.collection.id)
+    expected_params = expected_form_params(harmony_request)
+    return all(http_request.url == expected_url
+               and parse_multipart_data(http_request) == expected_params
+               for http_request in http_requests)
 
-def expected_capabilities_url(request_params: dict):
-    collection_id = request_params.get('collection_id')
-    short_name = request_params.get('short_name')
-    capabilities_version = request_params.get('capabilities_version')
+def expected_capabilities_url(collection_id=None, short_name=None, capabilities_version=None):
     url = 'https://harmony.earthdata.nasa.gov/capabilities'
     if collection_id:
         url = (f'{url}?collectionid={collection_id}')
@@ -159,112 +253,162 @@ def fake_data_url(link_type: LinkType = LinkType.https):
         fake_data_url = f'{link_type.value}://harmony.earthdata.nasa.gov/service-results'
     return f'{fake_data_url}/fake.tif'
 
-def expected_user_agent_header_regex():
-    # Since it's kinda overkill to find the exact character set
-    #   allowed in platform/implementation/version/etc,
-    #   the following regex may be a little bit more tolerant
-    return r"\s*([^/\s]+/[^/\s]+)(\s+[^/\s]+/[^/\s]+)*\s*"
+# Since it's kinda overkill to find the exact character set
+#   allowed in platform/implementation/version/etc,
+#   the following regex may be a little bit more tolerant
+EXPECTED_USER_AGENT_HEADER_RE = re.compile(r"\s*([^/\s]+/[^/\s]+)(\s+[^/\s]+/[^/\s]+)*\s*")
+
+# Fields shared by every expected job; links and jobID are filled in by expected_job
+EXPECTED_JOB = {
+    'username': 'rfeynman',
+    'status': 'running',
+    'message': 'The job is being processed',
+    'progress': 0,
+    'createdAt': '2021-02-19T18:47:31.291Z',
+    'updatedAt': '2021-02-19T18:47:31.291Z',
+    'dataExpiration': '2021-03-21T18:47:31.291Z',
+    'links': None,
+    'request': (
+        'https://harmony.earthdata.nasa.gov/{collection_id}/ogc-api-coverages/1.0.0'
+        '/collections/parameter_vars/coverage/rangeset'
+        '?forceAsync=True'
+        '&subset=lat(52%3A77)'
+        '&subset=lon(-165%3A-140)'
+        '&subset=time(%222010-01-01T00%3A00%3A00%22%3A%222020-12-30T00%3A00%3A00%22)'
+        '&variable=all'
+    ),
+    'numInputGranules': 32,
+    'jobID': None
+}
+
+EXPECTED_DATA_LINK = {
+    'href': None,
+    'title': '2020_01_15_fake.nc.tif',
+    'type': 'image/tiff',
+    'rel': 'data',
+    'bbox': [
+        -179.95,
+        -89.95,
+        179.95,
+        89.95
+    ],
+    'temporal': {
+        'start': '2020-01-15T00:00:00.000Z',
+        'end': '2020-01-15T23:59:59.000Z'
+    }
+}
+
+def expected_job_links(job_id, link_type: LinkType = LinkType.https):
+    """Returns the status, STAC catalog and data links of a job."""
+    return [
+        {
+            'title': 'Job Status',
+            'href': f'https://harmony.earthdata.nasa.gov/jobs/{job_id}',
+            'rel': 'self',
+            'type': 'application/json'
+        },
+        {
+            'title': 'STAC catalog',
+            'href': f'https://harmony.earthdata.nasa.gov/stac/{job_id}/',
+            'rel': 'stac-catalog-json',
+            'type': 'application/json'
+        },
+        {**EXPECTED_DATA_LINK, 'href': fake_data_url(link_type)}
+    ]
 
 def expected_job(collection_id, job_id, link_type: LinkType = LinkType.https, extra_links=[]):
     return {
-        'username': 'rfeynman',
-        'status': 'running',
-        'message': 'The job is being processed',
-        'progress': 0,
-        'createdAt': '2021-02-19T18:47:31.291Z',
-        'updatedAt': '2021-02-19T18:47:31.291Z',
-        'dataExpiration': '2021-03-21T18:47:31.291Z',
-        'links': [
-            {
-                'title': 'Job Status',
-                'href': f'https://harmony.earthdata.nasa.gov/jobs/{job_id}',
-                'rel': 'self',
-                'type': 'application/json'
-            },
-            {
-                'title': 'STAC catalog',
-                'href': f'https://harmony.earthdata.nasa.gov/stac/{job_id}/',
-                'rel': 'stac-catalog-json',
-                'type': 'application/json'
-            },
-            {
-                'href': fake_data_url(link_type),
-                'title': '2020_01_15_fake.nc.tif',
-                'type': 'image/tiff',
-                'rel': 'data',
-                'bbox': [
-                    -179.95,
-                    -89.95,
-                    179.95,
-                    89.95
-                ],
-                'temporal': {
-                    'start': '2020-01-15T00:00:00.000Z',
-                    'end': '2020-01-15T23:59:59.000Z'
-                }
-            },
-            *extra_links
-        ],
-        'request': (
-            'https://harmony.earthdata.nasa.gov/{collection_id}/ogc-api-coverages/1.0.0'
-            '/collections/parameter_vars/coverage/rangeset'
-            '?forceAsync=True'
-            '&subset=lat(52%3A77)'
-            '&subset=lon(-165%3A-140)'
-            '&subset=time(%222010-01-01T00%3A00%3A00%22%3A%222020-12-30T00%3A00%3A00%22)'
-            '&variable=all'
-        ),
-        'numInputGranules': 32,
+        **EXPECTED_JOB,
+        'links': [*expected_job_links(job_id, link_type), *extra_links],
         'jobID': f'{job_id}'
     }
 
-def expected_paused_job(collection_id, job_id, link_type: LinkType = LinkType.https, extra_links=[]):
-    job = expected_job(collection_id, job_id, link_type, extra_links)
-    job['status'] = 'paused'
-    job['progress'] = 10
-    return job
+DEFAULT_JOB_ID = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
+# Built once and shared; tests that need a different job build a new dict from it
+DEFAULT_JOB = expected_job('C333666999-EOSDIS', DEFAULT_JOB_ID)
+DEFAULT_JOB_BODY = json.dumps(DEFAULT_JOB)
 
-def expected_capabilities(collection_id):
+def expected_job_body(collection_id, job_id):
+    """Returns expected_job serialized as a JSON response body."""
+    return json.dumps(expected_job(collection_id, job_id))
+
+def expected_paused_job(collection_id, job_id, link_type: LinkType = LinkType.https, extra_links=[]):
     return {
-        'conceptId': 'C1940468263-POCLOUD',
-        'shortName': 'SMAP_RSS_L3_SSS_SMI_8DAY-RUNNINGMEAN_V4',
-        'variableSubset': False,
-        'bboxSubset': False,
-        'shapeSubset': False,
-        'concatenate': True,
-        'reproject': False,
-        'outputFormats': [
-            'application/x-zarr'
-        ],
-        'services': [
-            {
-                'name': 'harmony/netcdf-to-zarr',
-                'href': 'https://cmr.earthdata.nasa.gov/search/concepts/S2009180097-POCLOUD',
-                'capabilities': {
-                        'concatenation': True,
-                        'concatenate_by_default': False,
-                        'subsetting': {
-                            'variable': False
-                        },
-                    'output_formats': [
-                            'application/x-zarr'
-                        ]
-                }
-            }
-        ],
-        'variables': [
-            {
-                'name': 'fland',
-                'href': 'https://cmr.earthdata.nasa.gov/search/concepts/V2093907988-POCLOUD'
-            },
-            {
-                'name': 'time',
-                'href': 'https://cmr.earthdata.nasa.gov/search/concepts/V2112018545-POCLOUD'
-            }
-        ],
-        'capabilitiesVersion': '2'
+        **expected_job(collection_id, job_id, link_type, extra_links),
+        'status': 'paused',
+        'progress': 10
     }
 
+def parse_timestamp(timestamp):
+    """Parses the UTC ISO 8601 timestamps ('...Z') used in the expected job JSON."""
+    return dt.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+def expected_job_status(exp_job):
+    """Returns the status Client.status should report for the given job JSON."""
+    created_at = parse_timestamp(exp_job['createdAt'])
+    updated_at = parse_timestamp(exp_job['updatedAt'])
+    status = {
+        'status': exp_job['status'],
+        'message': exp_job['message'],
+        'progress': exp_job['progress'],
+        'created_at': created_at,
+        'updated_at': updated_at,
+        'created_at_local': created_at.replace(microsecond=0).astimezone().isoformat(),
+        'updated_at_local': updated_at.replace(microsecond=0).astimezone().isoformat(),
+        'request': exp_job['request'],
+        'num_input_granules': exp_job['numInputGranules']}
+    if 'dataExpiration' in exp_job:
+        data_expiration = parse_timestamp(exp_job['dataExpiration'])
+        status['data_expiration'] = data_expiration
+        status['data_expiration_local'] = \
+            data_expiration.replace(microsecond=0).astimezone().isoformat()
+    if 'errors' in exp_job:
+        status['errors'] = exp_job['errors']
+    return status
+
+EXPECTED_CAPABILITIES = {
+    'conceptId': 'C1940468263-POCLOUD',
+    'shortName': 'SMAP_RSS_L3_SSS_SMI_8DAY-RUNNINGMEAN_V4',
+    'variableSubset': False,
+    'bboxSubset': False,
+    'shapeSubset': False,
+    'concatenate': True,
+    'reproject': False,
+    'outputFormats': [
+        'application/x-zarr'
+    ],
+    'services': [
+        {
+            'name': 'harmony/netcdf-to-zarr',
+            'href': 'https://cmr.earthdata.nasa.gov/search/concepts/S2009180097-POCLOUD',
+            'capabilities': {
+                'concatenation': True,
+                'concatenate_by_default': False,
+                'subsetting': {
+                    'variable': False
+                },
+                'output_formats': [
+                    'application/x-zarr'
+                ]
+            }
+        }
+    ],
+    'variables': [
+        {
+            'name': 'fland',
+            'href': 'https://cmr.earthdata.nasa.gov/search/concepts/V2093907988-POCLOUD'
+        },
+        {
+            'name': 'time',
+            'href': 'https://cmr.earthdata.nasa.gov/search/concepts/V2112018545-POCLOUD'
+        }
+    ],
+    'capabilitiesVersion': '2'
+}
+
+def expected_capabilities(collection_id):
+    return copy.deepcopy(EXPECTED_CAPABILITIES)
+
 @responses.activate
 def test_when_multiple_submits_it_only_authenticates_once():
     collection = Collection(id='C1940468263-POCLOUD')
@@ -292,60 +436,43 @@ def test_when_multiple_submits_it_only_authenticates_once():
 
     assert len(responses.calls) == 3
     assert responses.calls[0].request.url == auth_url
-    assert urllib.parse.unquote(responses.calls[0].request.url) == auth_url
-    assert is_expected_url_and_form_encoded_body(request, responses.calls[1].request)
-    assert is_expected_url_and_form_encoded_body(request, responses.calls[2].request)
+    assert is_expected_url_and_form_encoded_body(request, responses.calls[1].request,
+                                                 responses.calls[2].request)
 
-@responses.activate
-def test_with_bounding_box():
-    collection = Collection(id='C1940468263-POCLOUD')
-    request = Request(
-        collection=collection,
-        spatial=BBox(-107, 40, -105, 42)
-    )
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, job_id)
-    )
+@pytest.mark.parametrize('should_validate_auth', ['false', 'eager', None, 'LAZY'])
+def test_client_rejects_unknown_auth_validation_modes(should_validate_auth):
+    with pytest.raises(ValueError, match="should_validate_auth must be True, False or 'lazy'"):
+        Client(should_validate_auth=should_validate_auth)
 
-    actual_job_id = Client(should_validate_auth=False).submit(request)
+def test_close_releases_session_and_executor():
+    with Client(should_validate_auth=False) as client:
+        session = client._session()
+        assert session is client._session()
 
-    assert len(responses.calls) == 1
-    assert responses.calls[0].request is not None
-    assert is_expected_url_and_form_encoded_body(request, responses.calls[0].request)
-    assert actual_job_id == job_id
+    assert client.session is None
+    with pytest.raises(RuntimeError):
+        client.executor.submit(print)
 
-@responses.activate
-def test_with_single_dimension():
-    collection = Collection(id='C1940468263-POCLOUD')
-    request = Request(
-        collection=collection,
-        dimensions=[Dimension('foo', 0, 20.5)]
-    )
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, job_id)
-    )
+def test_closed_client_cannot_be_used():
+    client = Client(should_validate_auth=False)
+    client.close()
 
-    actual_job_id = Client(should_validate_auth=False).submit(request)
-
-    assert len(responses.calls) == 1
-    assert responses.calls[0].request is not None
-    assert is_expected_url_and_form_encoded_body(request, responses.calls[0].request)
-    assert actual_job_id == job_id
+    for use in (lambda: client.status('abcd-1234'),
+                lambda: client.submit(Request(collection=Collection('foobar'))),
+                lambda: client.submit_all([Request(collection=Collection('foobar'))]),
+                lambda: client.download('https://example.com/file.nc'),
+                lambda: next(client.download_all({'links': []}), None)):
+        with pytest.raises(RuntimeError, match='This Client has been closed'):
+            use()
 
 @responses.activate
-def test_with_multiple_dimensions():
-    collection = Collection(id='C1940468263-POCLOUD')
-    request = Request(
-        collection=collection,
-        dimensions=[
+@pytest.mark.parametrize('collection_id,request_params', [
+    pytest.param('C1940468263-POCLOUD', {'spatial': BBox(-107, 40, -105, 42)},
+                 id='bounding_box'),
+    pytest.param('C1940468263-POCLOUD', {'dimensions': [Dimension('foo', 0, 20.5)]},
+                 id='single_dimension'),
+    pytest.param('C1940468263-POCLOUD', {
+        'dimensions': [
             Dimension('foo', None, 20.5),
             Dimension(name='bar', max=20.1, min=-10.2),
             Dimension('baz'),
@@ -354,67 +481,30 @@ def test_with_multiple_dimensions():
             Dimension('charlie', min=20),
             Dimension('delta', 0, 20.5),
         ]
-    )
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, job_id)
-    )
-
-    actual_job_id = Client(should_validate_auth=False).submit(request)
-
-    assert len(responses.calls) == 1
-    assert responses.calls[0].request is not None
-    assert is_expected_url_and_form_encoded_body(request, responses.calls[0].request)
-    assert actual_job_id == job_id
-
-@responses.activate
-def test_with_temporal_range():
-    collection = Collection(id='C1234-TATOOINE')
-    request = Request(
-        collection=collection,
-        temporal={
+    }, id='multiple_dimensions'),
+    pytest.param('C1234-TATOOINE', {
+        'temporal': {
             'start': dt.datetime(2010, 12, 1),
             'stop': dt.datetime(2010, 12, 31)
-        },
-    )
-    job_id = '1234abcd-deed-9876-c001-f00dbad'
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, job_id)
-    )
-
-    actual_job_id = Client(should_validate_auth=False).submit(request)
-
-    assert len(responses.calls) == 1
-    assert responses.calls[0].request is not None
-    assert is_expected_url_and_form_encoded_body(request, responses.calls[0].request)
-    assert actual_job_id == job_id
-
-@responses.activate
-def test_with_bounding_box_and_temporal_range():
-    collection = Collection(id='C333666999-EOSDIS')
-    request = Request(
-        collection=collection,
-        spatial=BBox(-107, 40, -105, 42),
-        temporal={
+        }
+    }, id='temporal_range'),
+    pytest.param('C333666999-EOSDIS', {
+        'spatial': BBox(-107, 40, -105, 42),
+        'temporal': {
             'start': dt.datetime(2001, 1, 1),
             'stop': dt.datetime(2003, 3, 31)
-        },
-    )
-    job_id = '1234abcd-1234-9876-6666-999999abcd'
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, job_id)
+        }
+    }, id='bounding_box_and_temporal_range'),
+])
+def test_with_subset(collection_id, request_params, mock_submit, client):
+    collection = Collection(id=collection_id)
+    request = Request(
+        collection=collection,
+        **request_params
     )
+    job_id = mock_submit(collection.id)
 
-    actual_job_id = Client(should_validate_auth=False).submit(request)
+    actual_job_id = client.submit(request)
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request is not None
@@ -422,22 +512,16 @@ def test_with_bounding_box_and_temporal_range():
     assert actual_job_id == job_id
 
 @responses.activate
-def test_with_shapefile(examples_dir):
+def test_with_shapefile(asf_example, mock_submit, client):
     collection = Collection(id='C333666999-EOSDIS')
     request = Request(
         collection=collection,
-        shape=os.path.join(examples_dir, 'asf_example.json'),
+        shape=asf_example,
         spatial=BBox(-107, 40, -105, 42),
     )
-    job_id = '1234abcd-1234-9876-6666-999999abcd'
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, job_id)
-    )
+    job_id = mock_submit(collection.id, '1234abcd-1234-9876-6666-999999abcd')
 
-    actual_job_id = Client(should_validate_auth=False).submit(request)
+    actual_job_id = client.submit(request)
 
     assert len(responses.calls) == 1
 
@@ -460,30 +544,77 @@ def test_with_shapefile(examples_dir):
 
     assert actual_job_id == job_id
 
-def test_with_invalid_request():
+@responses.activate
+def test_submit_all_returns_job_ids_in_request_order(client, mocker):
+    collections = [Collection(id='C1234-TATOOINE'), Collection(id='C333666999-EOSDIS')]
+    job_ids = ['1234abcd-deed-9876-c001-f00dbad', '1234abcd-1234-9876-6666-999999abcd']
+    requests = [Request(collection=c, spatial=BBox(-107, 40, -105, 42)) for c in collections]
+    for collection, job_id in zip(collections, job_ids):
+        responses.add(
+            responses.POST,
+            expected_submit_url(collection.id),
+            status=200,
+            json=expected_job(collection.id, job_id)
+        )
+
+    spies = [mocker.spy(request, 'error_messages') for request in requests]
+
+    actual_job_ids = client.submit_all(requests)
+
+    assert len(responses.calls) == 2
+    assert actual_job_ids == job_ids
+    # Each request is validated once, up front
+    assert [spy.call_count for spy in spies] == [1, 1]
+
+@responses.activate
+def test_submit_all_creates_a_single_session(mocker, mock_submit):
+    sessions = []
+
+    def slow_create_session(*args, **kwargs):
+        # Widen the window in which concurrent workers could each create a session
+        threading.Event().wait(0.05)
+        sessions.append(create_session(*args, **kwargs))
+        return sessions[-1]
+
+    mocker.patch('harmony.harmony.create_session', side_effect=slow_create_session)
+    collection = Collection(id='C1234-TATOOINE')
+    mock_submit(collection.id)
+
+    with Client(should_validate_auth=False) as client:
+        client.submit_all([Request(collection=collection) for _ in range(3)])
+
+    assert len(responses.calls) == 3
+    assert len(sessions) == 1
+
+def test_submit_all_with_invalid_request_submits_nothing(client):
+    requests = [
+        Request(collection=Collection(id='C1234-TATOOINE')),
+        Request(collection=Collection(id='C333666999-EOSDIS'), spatial=BBox(-190, -100, 100, 190))
+    ]
+
+    with pytest.raises(Exception) as e:
+        client.submit_all(requests)
+    assert 'Cannot submit the request' in str(e.value)
+
+def test_with_invalid_request(client):
     collection = Collection(id='C333666999-EOSDIS')
     request = Request(
         collection=collection,
         spatial=BBox(-190, -100, 100, 190)
     )
 
-    with pytest.raises(Exception):
-        Client(should_validate_auth=False).submit(request)
+    with pytest.raises(Exception, match='Cannot submit the request due to the following errors'):
+        client.submit(request)
 
 @responses.activate
-def test_get_request_has_user_agent_headers():
+def test_get_request_has_user_agent_headers(client, mock_submit):
     collection = Collection('foobar')
     request = Request(
         collection=collection,
     )
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, 'abcd-1234'),
-    )
+    mock_submit(collection.id, 'abcd-1234')
 
-    Client(should_validate_auth=False).submit(request)
+    client.submit(request)
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request is not None
@@ -491,26 +622,19 @@ def test_get_request_has_user_agent_headers():
     headers = responses.calls[0].request.headers
     assert "User-Agent" in headers
     user_agent_header = headers["User-Agent"]
-    assert re.match(
-        expected_user_agent_header_regex(), user_agent_header
-    )
+    assert EXPECTED_USER_AGENT_HEADER_RE.match(user_agent_header)
 
 @responses.activate
-def test_post_request_has_user_agent_headers(examples_dir):
+def test_post_request_has_user_agent_headers(asf_example, client, mock_submit):
     collection = Collection('foobar')
     request = Request(
         collection=collection,
-        shape=os.path.join(examples_dir, 'asf_example.json'),
+        shape=asf_example,
         spatial=BBox(-107, 40, -105, 42),
     )
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, 'abcd-1234'),
-    )
+    mock_submit(collection.id, 'abcd-1234')
 
-    Client(should_validate_auth=False).submit(request)
+    client.submit(request)
 
     assert len(responses.calls) == 1
     assert len(responses.calls) == 1
@@ -519,80 +643,75 @@ def test_post_request_has_user_agent_headers(examples_dir):
     headers = responses.calls[0].request.headers
     assert "User-Agent" in headers
     user_agent_header = headers["User-Agent"]
-    assert re.match(
-        expected_user_agent_header_regex(), user_agent_header
-    )
+    assert EXPECTED_USER_AGENT_HEADER_RE.match(user_agent_header)
 
 @responses.activate
-def test_post_request_has_default_label(examples_dir):
+def test_post_request_has_default_label(asf_example, client, mock_submit):
     collection = Collection('foobar')
     request = Request(
         collection=collection,
-        shape=os.path.join(examples_dir, 'asf_example.json'),
+        shape=asf_example,
         spatial=BBox(-107, 40, -105, 42),
     )
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, 'abcd-1234'),
-    )
+    mock_submit(collection.id, 'abcd-1234')
 
-    Client(should_validate_auth=False).submit(request)
+    client.submit(request)
     form_data_params = parse_multipart_data(responses.calls[0].request)
     label = form_data_params['label']
     assert label == DEFAULT_JOB_LABEL
 
 @responses.activate
-def test_user_labels_and_default_label(examples_dir):
+def test_user_labels_and_default_label(asf_example, client, mock_submit):
     collection = Collection('foobar')
     request = Request(
         collection=collection,
-        shape=os.path.join(examples_dir, 'asf_example.json'),
+        shape=asf_example,
         spatial=BBox(-107, 40, -105, 42),
         labels=['one', 'two'],
     )
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, 'abcd-1234'),
-    )
+    mock_submit(collection.id, 'abcd-1234')
 
-    Client(should_validate_auth=False).submit(request)
+    client.submit(request)
     form_data_params = parse_multipart_data(responses.calls[0].request)
     label = form_data_params['label']
     assert label == ['one', 'two', DEFAULT_JOB_LABEL]
 
 @responses.activate
-def test_user_labels_and_no_default_label(examples_dir):
+def test_resubmitting_request_does_not_modify_its_labels(client, mock_submit):
     collection = Collection('foobar')
     request = Request(
         collection=collection,
-        shape=os.path.join(examples_dir, 'asf_example.json'),
-        spatial=BBox(-107, 40, -105, 42),
         labels=['one', 'two'],
     )
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, 'abcd-1234'),
-    )
+    mock_submit(collection.id, 'abcd-1234')
 
-    origninal_exclude_label = os.getenv('EXCLUDE_DEFAULT_LABEL')
+    client.submit(request)
+    client.submit(request)
+
+    assert request.labels == ['one', 'two']
+    form_data_params = parse_multipart_data(responses.calls[1].request)
+    assert form_data_params['label'] == ['one', 'two', DEFAULT_JOB_LABEL]
+
+@responses.activate
+def test_user_labels_and_no_default_label(asf_example, monkeypatch, client, mock_submit):
+    collection = Collection('foobar')
+    request = Request(
+        collection=collection,
+        shape=asf_example,
+        spatial=BBox(-107, 40, -105, 42),
+        labels=['one', 'two'],
+    )
+    mock_submit(collection.id, 'abcd-1234')
 
-    os.environ['EXCLUDE_DEFAULT_LABEL'] = 'true'
+    monkeypatch.setenv('EXCLUDE_DEFAULT_LABEL', 'true')
 
-    Client(should_validate_auth=False).submit(request)
+    client.submit(request)
     form_data_params = parse_multipart_data(responses.calls[0].request)
     label = form_data_params['label']
     assert label == ['one', 'two']
 
-    os.environ['EXCLUDE_DEFAULT_LABEL'] = origninal_exclude_label or ''
-
 
-@pytest.mark.parametrize('param,expected', [
+QUERY_PARAM_CASES = [
     ({'crs': 'epsg:3141'}, 'outputcrs=epsg:3141'),
     ({'destination_url': 's3://bucket'}, 'destinationUrl=s3://bucket'),
     ({'format': 'r2d2/hologram'}, 'format=r2d2/hologram'),
@@ -609,29 +728,20 @@ def test_user_labels_and_no_default_label(examples_dir):
     ({'grid': 'theGridName'}, 'grid=theGridName'),
     ({'extend': ['lat', 'lon']}, 'extend=lat&extend=lon'),
     ({'extend': ['singleDimension']}, 'extend=singleDimension'),
-])
+]
 
 @responses.activate
-def test_request_has_query_param(param, expected):
-    expected += '&forceAsync=true&variable=all'
+@pytest.mark.parametrize('param,expected', QUERY_PARAM_CASES)
+def test_request_has_query_param(param, expected, client, mock_submit):
     collection = Collection('foobar')
-    request = Request(
-        collection=collection,
-        **param
-    )
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=200,
-        json=expected_job(collection.id, 'abcd-1234'),
-    )
+    mock_submit(collection.id, 'abcd-1234')
 
-    Client(should_validate_auth=False).submit(request)
+    client.submit(Request(collection=collection, **param))
 
     assert len(responses.calls) == 1
 
     body_params = parse_multipart_data(responses.calls[0].request)
-    expected_params = construct_expected_params(expected)
+    expected_params = construct_expected_params(expected + '&forceAsync=true&variable=all')
 
     assert body_params == expected_params
 
@@ -641,71 +751,41 @@ def test_request_has_query_param(param, expected):
     (['red_var', 'green_var', 'blue_var'], 'red_var,green_var,blue_var'),
     (['/var/with/a/path'], '%2Fvar%2Fwith%2Fa%2Fpath')
 ])
-def test_request_has_variables(variables, expected):
+def test_request_has_variables(variables, expected, client, mock_submit):
     collection = Collection('foobar')
     request = Request(
         collection=collection,
         variables=variables
     )
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id, expected),
-        status=200,
-        json=expected_job(collection.id, 'abcd-1234'),
-    )
+    mock_submit(collection.id, 'abcd-1234')
 
-    Client(should_validate_auth=False).submit(request)
+    client.submit(request)
 
 @responses.activate
-def test_status():
-    collection = Collection(id='C333666999-EOSDIS')
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
-    exp_job = expected_job(collection.id, job_id)
-    expected_status = {
-        'status': exp_job['status'],
-        'message': exp_job['message'],
-        'progress': exp_job['progress'],
-        'created_at': dateutil.parser.parse(exp_job['createdAt']),
-        'updated_at': dateutil.parser.parse(exp_job['updatedAt']),
-        'data_expiration': dateutil.parser.parse(exp_job['dataExpiration']),
-        'created_at_local': dateutil.parser.parse(exp_job['createdAt']).replace(microsecond=0).astimezone().isoformat(),
-        'updated_at_local': dateutil.parser.parse(exp_job['updatedAt']).replace(microsecond=0).astimezone().isoformat(),
-        'data_expiration_local': dateutil.parser.parse(exp_job['dataExpiration']).replace(microsecond=0).astimezone().isoformat(),
-        'request': exp_job['request'],
-        'num_input_granules': exp_job['numInputGranules']}
+def test_status(client):
+    job_id = DEFAULT_JOB_ID
+    exp_job = DEFAULT_JOB
+    expected_status = expected_job_status(exp_job)
     responses.add(
         responses.GET,
         expected_status_url(job_id),
         status=200,
-        json=exp_job
+        body=DEFAULT_JOB_BODY,
+        content_type='application/json'
     )
 
-    actual_status = Client(should_validate_auth=False).status(job_id)
+    actual_status = client.status(job_id)
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request is not None
-    assert urllib.parse.unquote(responses.calls[0].request.url) == expected_status_url(job_id)
+    assert called_urls()[0] == expected_status_url(job_id)
     assert actual_status == expected_status
 
 @responses.activate
-def test_status_with_errors():
-    collection = Collection(id='C333666999-EOSDIS')
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
-    exp_job = expected_job(collection.id, job_id)
-    exp_job['errors'] = ['some error']
-    expected_status = {
-        'status': exp_job['status'],
-        'message': exp_job['message'],
-        'progress': exp_job['progress'],
-        'created_at': dateutil.parser.parse(exp_job['createdAt']),
-        'updated_at': dateutil.parser.parse(exp_job['updatedAt']),
-        'data_expiration': dateutil.parser.parse(exp_job['dataExpiration']),
-        'created_at_local': dateutil.parser.parse(exp_job['createdAt']).replace(microsecond=0).astimezone().isoformat(),
-        'updated_at_local': dateutil.parser.parse(exp_job['updatedAt']).replace(microsecond=0).astimezone().isoformat(),
-        'data_expiration_local': dateutil.parser.parse(exp_job['dataExpiration']).replace(microsecond=0).astimezone().isoformat(),
-        'request': exp_job['request'],
-        'errors': ['some error'],
-        'num_input_granules': exp_job['numInputGranules']}
+def test_status_with_errors(client):
+    job_id = DEFAULT_JOB_ID
+    exp_job = {**DEFAULT_JOB, 'errors': ['some error']}
+    expected_status = expected_job_status(exp_job)
     responses.add(
         responses.GET,
         expected_status_url(job_id),
@@ -713,26 +793,15 @@ def test_status_with_errors():
         json=exp_job
     )
 
-    actual_status = Client(should_validate_auth=False).status(job_id)
+    actual_status = client.status(job_id)
 
     assert actual_status == expected_status
 
 @responses.activate
-def test_status_no_key_error_on_missing_expiration():
-    collection = Collection(id='C333666999-EOSDIS')
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
-    exp_job = expected_job(collection.id, job_id)
-    del exp_job['dataExpiration']
-    expected_status = {
-        'status': exp_job['status'],
-        'message': exp_job['message'],
-        'progress': exp_job['progress'],
-        'created_at': dateutil.parser.parse(exp_job['createdAt']),
-        'updated_at': dateutil.parser.parse(exp_job['updatedAt']),
-        'created_at_local': dateutil.parser.parse(exp_job['createdAt']).replace(microsecond=0).astimezone().isoformat(),
-        'updated_at_local': dateutil.parser.parse(exp_job['updatedAt']).replace(microsecond=0).astimezone().isoformat(),
-        'request': exp_job['request'],
-        'num_input_granules': exp_job['numInputGranules']}
+def test_status_no_key_error_on_missing_expiration(client):
+    job_id = DEFAULT_JOB_ID
+    exp_job = {k: v for k, v in DEFAULT_JOB.items() if k != 'dataExpiration'}
+    expected_status = expected_job_status(exp_job)
     responses.add(
         responses.GET,
         expected_status_url(job_id),
@@ -740,33 +809,33 @@ def test_status_no_key_error_on_missing_expiration():
         json=exp_job
     )
 
-    actual_status = Client(should_validate_auth=False).status(job_id)
+    actual_status = client.status(job_id)
     assert actual_status == expected_status
 
 @responses.activate
-def test_progress():
-    collection = Collection(id='C333666999-EOSDIS')
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
-    exp_job = expected_job(collection.id, job_id)
+def test_progress(client):
+    job_id = DEFAULT_JOB_ID
+    exp_job = DEFAULT_JOB
     expected_progress = int(exp_job['progress']), exp_job['status'], exp_job['message']
     responses.add(
         responses.GET,
         expected_status_url(job_id),
         status=200,
-        json=exp_job
+        body=DEFAULT_JOB_BODY,
+        content_type='application/json'
     )
 
-    actual_progress = Client(should_validate_auth=False).progress(job_id)
+    actual_progress = client.progress(job_id)
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request is not None
-    assert urllib.parse.unquote(responses.calls[0].request.url) == expected_status_url(job_id)
+    assert called_urls()[0] == expected_status_url(job_id)
     assert actual_progress == expected_progress
 
 @responses.activate
-def test_pause():
+def test_pause(client):
     collection = Collection(id='C333666999-EOSDIS')
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
+    job_id = DEFAULT_JOB_ID
     exp_job = expected_paused_job(collection, job_id)
     responses.add(
         responses.GET,
@@ -775,15 +844,15 @@ def test_pause():
         json=exp_job
     )
 
-    Client(should_validate_auth=False).pause(job_id)
+    client.pause(job_id)
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request is not None
-    assert urllib.parse.unquote(responses.calls[0].request.url) == expected_pause_url(job_id)
+    assert called_urls()[0] == expected_pause_url(job_id)
 
 @responses.activate
-def test_pause_conflict_error():
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
+def test_pause_conflict_error(client):
+    job_id = DEFAULT_JOB_ID
     exp_json = {
         'code': 'harmony.ConflictError',
         'description': 'Error: Job status cannot be updated from successful to paused.'
@@ -797,13 +866,13 @@ def test_pause_conflict_error():
     )
 
     with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).pause(job_id)
+        client.pause(job_id)
     assert str(e.value) == "('Conflict', 'Error: Job status cannot be updated from successful to paused.')"
 
 @responses.activate
-def test_resume():
+def test_resume(client):
     collection = Collection(id='C333666999-EOSDIS')
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
+    job_id = DEFAULT_JOB_ID
     exp_job = expected_paused_job(collection, job_id)
     responses.add(
         responses.GET,
@@ -812,15 +881,15 @@ def test_resume():
         json=exp_job
     )
 
-    Client(should_validate_auth=False).resume(job_id)
+    client.resume(job_id)
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request is not None
-    assert urllib.parse.unquote(responses.calls[0].request.url) == expected_resume_url(job_id)
+    assert called_urls()[0] == expected_resume_url(job_id)
 
 @responses.activate
-def test_resume_conflict_error():
-    job_id = '21469294-d6f7-42cc-89f2-c81990a5d7f4'
+def test_resume_conflict_error(client):
+    job_id = DEFAULT_JOB_ID
     exp_json = {
         'code': 'harmony.ConflictError',
         'description': 'Error: Job status is running - only paused jobs can be resumed.'
@@ -834,14 +903,10 @@ def test_resume_conflict_error():
     )
 
     with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).resume(job_id)
+        client.resume(job_id)
     assert str(e.value) == "('Conflict', 'Error: Job status is running - only paused jobs can be resumed.')"
 
-@pytest.mark.parametrize('show_progress', [
-    (True),
-    (False),
-])
-def test_wait_for_processing_with_show_progress(mocker, show_progress):
+def test_wait_for_processing_with_show_progress(mocker, client, sleep_calls, progressbar_mock):
     expected_progress = [
         (80, 'running', 'The job is being processed'),
         (90, 'running', 'The job is being processed'),
@@ -849,45 +914,36 @@ def test_wait_for_processing_with_show_progress(mocker, show_progress):
     ]
     job_id = '12345'
 
-    progressbar_mock = mocker.Mock()
-    progressbar_mock.__enter__ = lambda _: progressbar_mock
-    progressbar_mock.__exit__ = lambda a, b, d, c: None
-    mocker.patch('harmony.harmony.progressbar.ProgressBar', return_value=progressbar_mock)
+    progress_mock = mocker.patch('harmony.harmony.Client.progress')
 
-    sleep_mock = mocker.Mock()
-    mocker.patch('harmony.harmony.time.sleep', sleep_mock)
+    for show_progress in (True, False):
+        progress_mock.reset_mock(side_effect=True)
+        progress_mock.side_effect = expected_progress
+        sleep_calls.clear()
+        progressbar_mock.update.reset_mock()
 
-    progress_mock = mocker.Mock(side_effect=expected_progress)
-    mocker.patch('harmony.harmony.Client.progress', progress_mock)
-
-    client = Client(should_validate_auth=False)
-    client.wait_for_processing(job_id, show_progress=show_progress)
+        client.wait_for_processing(job_id, show_progress=show_progress)
 
-    progress_mock.assert_called_with(job_id)
-    if show_progress:
-        for n, _, _ in expected_progress:
-            progressbar_mock.update.assert_any_call(int(n))
-    else:
-        assert sleep_mock.call_count == len(expected_progress)
+        progress_mock.assert_called_with(job_id)
+        if show_progress:
+            for n, _, _ in expected_progress:
+                progressbar_mock.update.assert_any_call(int(n))
+        else:
+            assert progressbar_mock.update.call_count == 0
+            assert len(sleep_calls) == len(expected_progress)
 
 @pytest.mark.parametrize('show_progress', [
     (True),
     (False),
 ])
-def test_wait_for_processing_with_failed_status(mocker, show_progress):
+def test_wait_for_processing_with_failed_status(mocker, show_progress, client,
+                                                progressbar_mock):
     expected_progress = [(0, 'failed', 'Pod exploded')]
     job_id = '12345'
 
-    progressbar_mock = mocker.Mock()
-    progressbar_mock.__enter__ = lambda _: progressbar_mock
-    progressbar_mock.__exit__ = lambda a, b, d, c: None
-    mocker.patch('harmony.harmony.progressbar.ProgressBar', return_value=progressbar_mock)
-
     progress_mock = mocker.Mock(side_effect=expected_progress)
     mocker.patch('harmony.harmony.Client.progress', progress_mock)
 
-    client = Client(should_validate_auth=False)
-
     with pytest.raises(ProcessingFailedException) as e:
         client.wait_for_processing(job_id, show_progress=show_progress)
     assert e.exconly() == 'harmony.harmony.ProcessingFailedException: Pod exploded'
@@ -896,24 +952,16 @@ def test_wait_for_processing_with_failed_status(mocker, show_progress):
     (True),
     (False),
 ])
-def test_wait_for_processing_with_paused_status(mocker, show_progress):
+def test_wait_for_processing_with_paused_status(mocker, show_progress, client, sleep_calls,
+                                                progressbar_mock):
     expected_progress = [
         (10, 'running', 'The job is being processed'),
         (10, 'paused', 'Job paused')]
     job_id = '12345'
 
-    sleep_mock = mocker.Mock()
-    mocker.patch('harmony.harmony.time.sleep', sleep_mock)
-
-    progressbar_mock = mocker.Mock()
-    progressbar_mock.__enter__ = lambda _: progressbar_mock
-    progressbar_mock.__exit__ = lambda a, b, d, c: None
-    mocker.patch('harmony.harmony.progressbar.ProgressBar', return_value=progressbar_mock)
-
     progress_mock = mocker.Mock(side_effect=expected_progress)
     mocker.patch('harmony.harmony.Client.progress', progress_mock)
 
-    client = Client(should_validate_auth=False)
     client.wait_for_processing(job_id, show_progress=show_progress)
 
     progress_mock.assert_called_with(job_id)
@@ -922,7 +970,7 @@ def test_wait_for_processing_with_paused_status(mocker, show_progress):
             progressbar_mock.update.assert_any_call(int(n))
     else:
         # sleep should be called just once since the second status update returned 'paused'
-        assert sleep_mock.call_count == 1
+        assert len(sleep_calls) == 1
 
 @responses.activate
 @pytest.mark.parametrize('show_progress', [
@@ -930,7 +978,7 @@ def test_wait_for_processing_with_paused_status(mocker, show_progress):
     (False),
 ])
 @pytest.mark.parametrize('link_type', [LinkType.http, LinkType.https, LinkType.s3])
-def test_result_json(mocker, show_progress, link_type):
+def test_result_json(mocker, show_progress, link_type, client):
     expected_json = '{}'
     job_id = '1234'
 
@@ -943,21 +991,16 @@ def test_result_json(mocker, show_progress, link_type):
         status=200,
         json=expected_json
     )
-    client = Client(should_validate_auth=False)
     actual_json = client.result_json(job_id, show_progress=show_progress, link_type=link_type)
 
     assert actual_json == expected_json
     wait_mock.assert_called_with(job_id, show_progress)
 
 @responses.activate
-@pytest.mark.parametrize('show_progress', [
-    (True),
-    (False),
-])
-@pytest.mark.parametrize('link_type', [LinkType.http, LinkType.https, LinkType.s3])
-def test_result_json_with_failed_request_doesnt_throw_exception(mocker, show_progress, link_type):
+def test_result_json_with_failed_request_doesnt_throw_exception(mocker, client):
     expected_json = '{"status": "failed", "message": "Pod exploded"}'
     job_id = '1234'
+    show_progress = False
 
     wait_mock = mocker.Mock(side_effect=ProcessingFailedException(job_id, "Pod exploded"))
     mocker.patch('harmony.harmony.Client.wait_for_processing', wait_mock)
@@ -968,19 +1011,14 @@ def test_result_json_with_failed_request_doesnt_throw_exception(mocker, show_pro
         status=200,
         json=expected_json
     )
-    client = Client(should_validate_auth=False)
     actual_json = client.result_json(job_id, show_progress=show_progress)
 
     assert actual_json == expected_json
     wait_mock.assert_called_with(job_id, show_progress)
 
 
-@pytest.mark.parametrize('show_progress', [
-    (True),
-    (False),
-])
 @pytest.mark.parametrize('link_type', [LinkType.http, LinkType.https, LinkType.s3])
-def test_result_urls(mocker, show_progress, link_type):
+def test_result_urls(mocker, link_type, client):
     collection = Collection(id='C1940468263-POCLOUD')
     job_id = '1234'
     expected_json = expected_job(collection.id, job_id, link_type)
@@ -991,21 +1029,15 @@ def test_result_urls(mocker, show_progress, link_type):
     mocker.patch('harmony.harmony.Client._get_json', result_json_mock)
     mocker.patch('harmony.harmony.Client.wait_for_processing', processing_mock)
 
-    client = Client(should_validate_auth=False)
-    actual_urls = list(client.result_urls(
-        job_id, show_progress=show_progress, link_type=link_type))
+    actual_urls = list(client.result_urls(job_id, link_type=link_type))
 
     assert actual_urls == expected_urls
     result_json_mock.assert_called_with(
         f'https://harmony.earthdata.nasa.gov/jobs/{job_id}?linktype={link_type.value}')
 
 
-@pytest.mark.parametrize('show_progress', [
-    (True),
-    (False),
-])
 @pytest.mark.parametrize('link_type', [LinkType.http, LinkType.https, LinkType.s3])
-def test_result_url_paging(mocker, show_progress, link_type):
+def test_result_url_paging(mocker, link_type, client):
     collection = Collection(id='C1940468263-POCLOUD')
     job_id = '1234'
     next_link = {
@@ -1021,9 +1053,7 @@ def test_result_url_paging(mocker, show_progress, link_type):
     mocker.patch('harmony.harmony.Client._get_json', get_json_mock)
     mocker.patch('harmony.harmony.Client.wait_for_processing', processing_mock)
 
-    client = Client(should_validate_auth=False)
-    actual_urls = list(client.result_urls(
-        job_id, show_progress=show_progress, link_type=link_type))
+    actual_urls = list(client.result_urls(job_id, link_type=link_type))
 
     assert actual_urls == expected_urls
     get_json_mock.assert_any_call(
@@ -1032,77 +1062,60 @@ def test_result_url_paging(mocker, show_progress, link_type):
         f'https://harmony.earthdata.nasa.gov/jobs/{job_id}?linktype={link_type.value}&page=2')
 
 
+EXPECTED_DATA = b'abcde'
+UNEXPECTED_DATA = b'vwxyz'
+
 @pytest.mark.parametrize('overwrite', [
     (True),
     (False),
 ])
-def test_download_file(overwrite):
-    # On first iteration, the local file is created with 'incorrect' data
-    #   - overwrite is True so local file is overwritten with expected_data
-    #   - assert filename and data are correct
-    # On second iteration, the local file is not overwritten
-    #   - AssertionError is thrown by pytest responses because no GET is actually performed
-    #   - assert filename and data are still correct
-    #   - local test file is deleted
-    expected_data = bytes('abcde', encoding='utf-8')
-    unexpected_data = bytes('vwxyz', encoding='utf-8')
-    expected_filename = 'pytest_tempfile.temp'
-    url = 'http://example.com/' + expected_filename
+def test_download_file(overwrite, client, tmp_path):
+    # The local file is created with 'incorrect' data first
+    #   - when overwrite is True, the local file is overwritten with EXPECTED_DATA
+    #   - when overwrite is False, pytest responses throws an AssertionError because no GET
+    #     is actually performed, and the local file keeps its original data
+    expected_filename = str(tmp_path / 'pytest_tempfile.temp')
+    url = 'http://example.com/pytest_tempfile.temp'
     actual_output = None
 
-    with io.BytesIO() as file_obj:
-        file_obj.write(expected_data)
-        file_obj.seek(0)
-
-        if overwrite:
-            with open(expected_filename, 'wb') as f:
-                f.write(unexpected_data)
+    with open(expected_filename, 'wb') as f:
+        f.write(UNEXPECTED_DATA)
 
+    if overwrite:
+        with responses.RequestsMock() as resp_mock:
+            resp_mock.add(responses.GET, url, body=EXPECTED_DATA, stream=True)
+            actual_output = client._download_file(url, str(tmp_path), overwrite=overwrite)
+    else:
+        with pytest.raises(AssertionError):
+            # throws AssertionError because requests GET is never actually called here
             with responses.RequestsMock() as resp_mock:
-                resp_mock.add(responses.GET, url, body=file_obj.read(), stream=True)
-                client = Client(should_validate_auth=False)
-                actual_output = client._download_file(url, overwrite=overwrite)
-        else:
-            with pytest.raises(AssertionError):
-                # throws AssertionError because requests GET is never actually called here
-                with responses.RequestsMock() as resp_mock:
-                    resp_mock.add(responses.GET, url, body=file_obj.read(), stream=True)
-                    client = Client(should_validate_auth=False)
-                    actual_output = client._download_file(url, overwrite=overwrite)
+                resp_mock.add(responses.GET, url, body=EXPECTED_DATA, stream=True)
+                actual_output = client._download_file(url, str(tmp_path), overwrite=overwrite)
 
     assert actual_output == expected_filename
     with open(expected_filename, 'rb') as temp_file:
         data = temp_file.read()
-        assert data == expected_data
-
-    if not overwrite:
-        os.unlink(expected_filename)
+        assert data == (EXPECTED_DATA if overwrite else UNEXPECTED_DATA)
 
-def test_download_opendap_file():
-    expected_data = bytes('abcde', encoding='utf-8')
+def test_download_opendap_file(mocker, client):
     filename = 'SC:ATL03.006:264549068'
     expected_filename = 'SC_ATL03.006_264549068'
     query = '?dap4.ce=/ds_surf_type[0:1:4]'
     path = 'https://opendap.uat.earthdata.nasa.gov/collections/C1261703111-EEDTEST/granules/'
     url = path + filename + query
     actual_output = None
-
-    with io.BytesIO() as file_obj:
-        file_obj.write(expected_data)
-        file_obj.seek(0)
-        with responses.RequestsMock() as resp_mock:
-            resp_mock.add(responses.POST, path + filename, body=file_obj.read(), stream=True,
-                match=[responses.matchers.urlencoded_params_matcher({"dap4.ce": "/ds_surf_type[0:1:4]"})])
-            client = Client(should_validate_auth=False)
-            actual_output = client._download_file(url, overwrite=False)
+    written = {}
+    mocker.patch('harmony.harmony.Client._write_bytes',
+                 lambda self, filename, stream: written.update({filename: stream.read()}))
+
+    with responses.RequestsMock() as resp_mock:
+        resp_mock.add(responses.POST, path + filename, body=EXPECTED_DATA, stream=True,
+            match=[responses.matchers.urlencoded_params_matcher({"dap4.ce": "/ds_surf_type[0:1:4]"})])
+        actual_output = client._download_file(url, overwrite=False)
     assert actual_output == expected_filename
-    with open(expected_filename, 'rb') as temp_file:
-        data = temp_file.read()
-        assert data == expected_data
-
-    os.unlink(actual_output)
+    assert written == {expected_filename: EXPECTED_DATA}
 
-def test_download_all(mocker):
+def test_download_all(mocker, client):
     expected_urls = [
         'http://www.example.com/1',
         'http://www.example.com/2',
@@ -1117,13 +1130,13 @@ def test_download_all(mocker):
         lambda self, url, a, b: url.split('/')[-1]
     )
 
-    client = Client(should_validate_auth=False)
-    actual_file_names = [f.result() for f in client.download_all('abcd-1234')]
-
-    assert actual_file_names == expected_file_names
+    # download_all is a generator; check each future as it is yielded
+    futures = client.download_all('abcd-1234')
+    for expected_file_name, future in zip_longest(expected_file_names, futures):
+        assert future is not None and future.result() == expected_file_name
 
 
-def test_download_all_zarr(mocker):
+def test_download_all_zarr(mocker, client):
     expected_urls = [
         'http://www.example.com/1',
         'http://www.example.com/2.zarr',
@@ -1137,16 +1150,12 @@ def test_download_all_zarr(mocker):
         lambda self, url, a, b: url.split('/')[-1]
     )
 
-    client = Client(should_validate_auth=False)
-
     with pytest.raises(Exception) as exc_info:
         client.download_all('abcd-1234')
         [f.result() for f in client.download_all('abcd-1234')]
     assert 'The zarr library must be used for zarr files.' in str(exc_info.value)
 
-def test_download_zarr():
-    client = Client(should_validate_auth=False)
-
+def test_download_zarr(client):
     with pytest.raises(Exception) as exc_info:
         client.download('https://www.example.com/file1.zarr')
     assert 'The zarr library must be used for zarr files.' in str(exc_info.value)
@@ -1243,119 +1252,108 @@ def extra_links_for_iteration(link_type: str):
 # this function provides a different value for subsequent calls to _get_json to simulate
 # changing status page
 def side_effect_for_get_json(extra_links) -> List[str]:
-    status_running1 = expected_job('C123', 'abc123')
-    status_running1['links'].append(extra_links[0])
-    status_running2 = copy.deepcopy(status_running1)
-    status_running2['links'].append(extra_links[1])
-    status_paused = copy.deepcopy(status_running2)
-    status_paused['status'] = 'paused'
-    status_paused['links'].append(extra_links[2])
-    status_resumed = copy.deepcopy(status_paused)
-    status_resumed['links'].append(extra_links[3])
-    status_resumed['status'] = 'running'
-    status_successful = copy.deepcopy(status_resumed)
-    status_successful['links'].append(extra_links[4])
-    status_successful['status'] = 'successful'
-
-    return [status_running1, status_running2, status_paused, status_resumed, status_successful, status_successful]
-
-def test_get_file_name_staged_link():
+    status = expected_job('C123', 'abc123')
+    links = status['links']
+    status_successful = {**status, 'status': 'successful', 'links': links + extra_links[:5]}
+
+    return [
+        {**status, 'status': 'running', 'links': links + extra_links[:1]},
+        {**status, 'status': 'running', 'links': links + extra_links[:2]},
+        {**status, 'status': 'paused', 'links': links + extra_links[:3]},
+        {**status, 'status': 'running', 'links': links + extra_links[:4]},
+        status_successful,
+        status_successful
+    ]
+
+
+@pytest.fixture(scope='module')
+def extra_links_by_type():
+    return {link_type: extra_links_for_iteration(link_type.value) for link_type in LinkType}
+
+
+@pytest.fixture(scope='module')
+def status_sequence_by_type(extra_links_by_type):
+    return {link_type: side_effect_for_get_json(extra_links)
+            for link_type, extra_links in extra_links_by_type.items()}
+
+def test_get_file_name_staged_link(client):
     # For staged results, the filename should get prefixed with the work item id, to avoid collisions
-    client = Client(should_validate_auth=False)
     actual_file_name = client.get_download_filename_from_url('https://harmony.earthdata.nasa.gov/service-results/staging-bucket/a7aee059-7531-4388-86e0-85af1de9c31a/1047412/C1254854453-LARC_CLOUD_merged.nc4')
     assert actual_file_name == '1047412_C1254854453-LARC_CLOUD_merged.nc4'
 
-def test_get_file_name_non_staged_link():
+def test_get_file_name_non_staged_link(client):
     # In this case, e.g. for a direct download data link, the filename should just be the last part of the URL path
-    client = Client(should_validate_auth=False)
     actual_file_name = client.get_download_filename_from_url('https://harmony.earthdata.nasa.gov/service-results/test-data/C1261703151-EEDTEST/ATL08_20181014001049_02350102_006_02.h5')
     assert actual_file_name == 'ATL08_20181014001049_02350102_006_02.h5'
 
-@pytest.mark.parametrize('link_type', [LinkType.http, LinkType.https, LinkType.s3])
-def test_iterator(link_type, mocker):
-    extra_links = extra_links_for_iteration(link_type.value)
-    status_page_json = expected_job('C123', 'abc123')
-    status_page_json['status'] = 'successful'
+def expected_granules(extra_links):
+    """Returns the (bbox, path) of each granule, in the order the iterator yields them."""
+    return [(BBox(-179.95, -89.95, 179.95, 89.95), '/tmp/fake.tif')] + [
+        (BBox(*link['bbox']), f'/tmp/fake{n}.tif') for n, link in enumerate(extra_links, start=2)
+    ]
+
+def iterate_status_pages(client, mocker, status_pages):
+    """Returns an iterator over job 'abc123' whose status page returns each of the given
+    status pages in turn."""
     download_file_mock = mocker.Mock(side_effect=side_effect_func_for_download_file)
     mocker.patch('harmony.harmony.Client._download_file', download_file_mock)
-    get_json_mock = mocker.Mock(side_effect=side_effect_for_get_json(extra_links))
+    get_json_mock = mocker.Mock(side_effect=status_pages)
     mocker.patch('harmony.harmony.Client._get_json', get_json_mock)
-    # speed up test by not waiting between polling the status page
-    client = Client(should_validate_auth=False, check_interval=0)
+    return ((granule_data['bbox'], granule_data['path'].result())
+            for granule_data in client.iterator('abc123', '/tmp'))
 
-    # first iteration in which job state is 'running' and two granules have completed
-    iter = client.iterator(status_page_json['jobID'], '/tmp')
-    granule_data = next(iter)
-    assert granule_data['bbox'] == BBox(-179.95, -89.95, 179.95, 89.95)
-    assert granule_data['path'].result() == '/tmp/fake.tif'
+@pytest.mark.parametrize('link_type', [LinkType.http, LinkType.https, LinkType.s3])
+def test_iterator_running_phase(link_type, mocker, extra_links_by_type, status_sequence_by_type,
+                                fast_client):
+    # job state is 'running' and two granules have completed, then a third completes
+    status_pages = status_sequence_by_type[link_type][0:2]
+    iter = iterate_status_pages(fast_client, mocker, status_pages)
 
-    granule_data = next(iter)
-    assert granule_data['bbox'] == BBox(*extra_links[0]['bbox'])
-    assert granule_data['path'].result() == '/tmp/fake2.tif'
+    granules = [next(iter) for _ in range(3)]
 
-    # job is still running and has another completed granule
-    granule_data = next(iter)
-    assert granule_data['bbox'] == BBox(*extra_links[1]['bbox'])
-    assert granule_data['path'].result() == '/tmp/fake3.tif'
+    assert granules == expected_granules(extra_links_by_type[link_type])[:3]
 
-    # job is paused and has another completed granule
-    granule_data = next(iter)
-    assert granule_data['bbox'] == BBox(*extra_links[2]['bbox'])
-    assert granule_data['path'].result() == '/tmp/fake4.tif'
+@pytest.mark.parametrize('link_type', [LinkType.http, LinkType.https, LinkType.s3])
+def test_iterator_paused_phase(link_type, mocker, extra_links_by_type, status_sequence_by_type,
+                               fast_client):
+    # job is paused; once its granules are downloaded the iterator stops
+    status_pages = status_sequence_by_type[link_type][2:3]
 
-    # once the new granules are downloaded for the paused job the iterator stops
-    granule_data = next(iter, None)
-    assert granule_data == None
+    granules = list(iterate_status_pages(fast_client, mocker, status_pages))
 
-    # need to start a new iterator after resuming
-    iter = client.iterator(status_page_json['jobID'], '/tmp')
-    # initial granules returned are the same as before (they are not re-downloaded by default)
-    granule_data = next(iter)
-    assert granule_data['bbox'] == BBox(-179.95, -89.95, 179.95, 89.95)
-    assert granule_data['path'].result() == '/tmp/fake.tif'
-    granule_data = next(iter)
-    assert granule_data['bbox'] == BBox(*extra_links[0]['bbox'])
-    assert granule_data['path'].result() == '/tmp/fake2.tif'
-    granule_data = next(iter)
-    assert granule_data['bbox'] == BBox(*extra_links[1]['bbox'])
-    assert granule_data['path'].result() == '/tmp/fake3.tif'
-    granule_data = next(iter)
-    assert granule_data['bbox'] == BBox(*extra_links[2]['bbox'])
-    assert granule_data['path'].result() == '/tmp/fake4.tif'
+    assert granules == expected_granules(extra_links_by_type[link_type])[:4]
 
-    # job is running and has another completed granule
-    granule_data = next(iter)
-    assert granule_data['bbox'] == BBox(*extra_links[3]['bbox'])
-    assert granule_data['path'].result() == '/tmp/fake5.tif'
+@pytest.mark.parametrize('link_type', [LinkType.http, LinkType.https, LinkType.s3])
+def test_iterator_resumed_phase(link_type, mocker, extra_links_by_type, status_sequence_by_type,
+                                fast_client):
+    # a new iterator after resuming returns the initial granules again (they are not
+    # re-downloaded by default), then the granule completed while running and the one
+    # completed as the job succeeded; it completes once the job is in a final state
+    status_pages = status_sequence_by_type[link_type][3:5]
 
-    # job has succeeded and has another completed granule
-    granule_data = next(iter)
-    assert granule_data['bbox'] == BBox(*extra_links[4]['bbox'])
-    assert granule_data['path'].result() == '/tmp/fake6.tif'
+    granules = list(iterate_status_pages(fast_client, mocker, status_pages))
 
-    # iterator completes after job is in a final state and there are no new granules
-    granule_data = next(iter, None)
-    assert granule_data == None
+    assert granules == expected_granules(extra_links_by_type[link_type])
 
 # this function provides a different value for subsequent calls to _get_json to simulate
 # changing status page - in this case the status changes from 'running' to 'failed'
 def side_effect_for_get_json_failed_job(extra_links) -> List[str]:
-    status_running = expected_job('C123', 'foo123')
-    status_running['links'].append(extra_links[0])
-    status_failed = copy.deepcopy(status_running)
-    status_failed['status'] = 'failed'
-    status_failed['message'] = 'Job failed'
+    status = expected_job('C123', 'foo123')
+    links = status['links'] + extra_links[:1]
 
-    return [status_running, status_failed]
+    return [
+        {**status, 'links': links},
+        {**status, 'status': 'failed', 'message': 'Job failed', 'links': links}
+    ]
 
 @pytest.mark.parametrize('link_type', [LinkType.http, LinkType.https, LinkType.s3])
-def test_iterator_failed_job(link_type, mocker):
+def test_iterator_failed_job(link_type, mocker, extra_links_by_type, fast_client):
     # test with two successful work items followed by a failed job
-    extra_links = extra_links_for_iteration(link_type.value)
+    extra_links = extra_links_by_type[link_type]
     get_json_mock = mocker.Mock(
         side_effect=side_effect_for_get_json_failed_job(extra_links=extra_links))
     mocker.patch('harmony.harmony.Client._get_json', get_json_mock)
-    client = Client(should_validate_auth=False, check_interval=0)
+    client = fast_client
 
     iter = client.iterator('foo123', '/tmp')
     granule_data = next(iter)
@@ -1373,12 +1371,11 @@ def test_iterator_failed_job(link_type, mocker):
 def side_effect_func_for_get_json_with_error(url: str):
     raise Exception('something bad happened')
 
-def test_iterator_retry(mocker):
-    os.environ['GET_JSON_RETRY_SLEEP'] = '0'
-    os.environ['GET_JSON_RETRY_LIMIT'] = '2'
+def test_iterator_retry(mocker, monkeypatch, client):
+    monkeypatch.setenv('GET_JSON_RETRY_SLEEP', '0')
+    monkeypatch.setenv('GET_JSON_RETRY_LIMIT', '2')
     get_json_mock = mocker.Mock(side_effect=side_effect_func_for_get_json_with_error)
     mocker.patch('harmony.harmony.Client._get_json', get_json_mock)
-    client = Client(should_validate_auth=False)
 
     # first iteration in which job state is 'running' and two granules have completed
     iter = client.iterator('foo', '/tmp')
@@ -1388,7 +1385,7 @@ def test_iterator_retry(mocker):
     assert get_json_mock.call_count == 2
 
 @pytest.mark.parametrize('link_type', [LinkType.http, LinkType.https, LinkType.s3])
-def test_stac_catalog_url(link_type, mocker):
+def test_stac_catalog_url(link_type, mocker, client):
     job_id = '1234'
     collection = Collection(id='C1940468263-POCLOUD')
     expected_json = expected_job(collection.id, job_id)
@@ -1398,13 +1395,12 @@ def test_stac_catalog_url(link_type, mocker):
     expected_stac_catalog_url = (f'https://harmony.earthdata.nasa.gov/stac'
                                  f'/{job_id}/?linktype={link_type.value}')
 
-    client = Client(should_validate_auth=False)
     actual_stac_catalog_url = client.stac_catalog_url(job_id, link_type=link_type)
 
     assert actual_stac_catalog_url == expected_stac_catalog_url
 
 @responses.activate
-def test_read_text(mocker):
+def test_read_text(mocker, client):
     url = 'http://www.example.com/1234'
     expected_text = '5678'
     responses.add(
@@ -1414,237 +1410,110 @@ def test_read_text(mocker):
         body=expected_text
     )
 
-    client = Client(should_validate_auth=False)
     actual_text = client.read_text(url)
 
     assert actual_text == expected_text
 
-@responses.activate
-def test_handle_error_response_with_description_key():
-    job_id = '3141592653-abcd-1234'
-    collection = Collection(id='C1940468263-POCLOUD')
-    request = Request(
-        collection=collection,
-        spatial=BBox(-107, 40, -105, 42)
-    )
-    error = {'code': 'harmony.ServerError', 'description': 'Error: Harmony had an internal issue.'}
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=500,
-        json=error
-    )
-    responses.add(
-        responses.GET,
-        expected_status_url(job_id),
-        status=500,
-        json=error
-    )
-    responses.add(
-        responses.GET,
-        expected_status_url(job_id),
-        status=500,
-        json=error
-    )
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).submit(request)
-    assert str(e.value) == f"('Internal Server Error', '{error['description']}')"
-
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).status(job_id)
-    assert str(e.value) == f"('Internal Server Error', '{error['description']}')"
-
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).progress(job_id)
-    assert str(e.value) == f"('Internal Server Error', '{error['description']}')"
+HTTP_ERROR_MESSAGE = re.escape('500 Server Error: Internal Server Error for url')
 
 @responses.activate
-def test_handle_error_response_no_description_key():
-    job_id = '3141592653-abcd-1234'
-    collection = Collection(id='C1940468263-POCLOUD')
-    request = Request(
-        collection=collection,
-        spatial=BBox(-107, 40, -105, 42)
-    )
-    error = {'unrecognizable_key': 'Some information.'}
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=500,
-        json=error
-    )
-    responses.add(
-        responses.GET,
-        expected_status_url(job_id),
-        status=500,
-        json=error
-    )
-    responses.add(
-        responses.GET,
-        expected_status_url(job_id),
-        status=500,
-        json=error
-    )
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).submit(request)
-    assert "500 Server Error: Internal Server Error for url" in str(e.value)
-
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).status(job_id)
-    assert "500 Server Error: Internal Server Error for url" in str(e.value)
-
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).progress(job_id)
-    assert "500 Server Error: Internal Server Error for url" in str(e.value)
-
-@responses.activate
-def test_handle_error_response_no_json():
-    job_id = '3141592653-abcd-1234'
-    collection = Collection(id='C1940468263-POCLOUD')
-    request = Request(
-        collection=collection,
-        spatial=BBox(-107, 40, -105, 42)
-    )
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=500,
-        body='error'
-    )
-    responses.add(
-        responses.GET,
-        expected_status_url(job_id),
-        status=500,
-        body='error'
-    )
-    responses.add(
-        responses.GET,
-        expected_status_url(job_id),
-        status=500,
-        body='error'
-    )
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).submit(request)
-    assert "500 Server Error: Internal Server Error for url" in str(e.value)
-
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).status(job_id)
-    assert "500 Server Error: Internal Server Error for url" in str(e.value)
-
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).progress(job_id)
-    assert "500 Server Error: Internal Server Error for url" in str(e.value)
-
-@responses.activate
-def test_handle_error_response_invalid_json():
+@pytest.mark.parametrize('payload,expected_message', [
+    pytest.param(
+        {'json': {'code': 'harmony.ServerError',
+                  'description': 'Error: Harmony had an internal issue.'}},
+        '^' + re.escape("('Internal Server Error', 'Error: Harmony had an internal issue.')") + '$',
+        id='with_description_key'),
+    pytest.param({'json': {'unrecognizable_key': 'Some information.'}}, HTTP_ERROR_MESSAGE,
+                 id='no_description_key'),
+    pytest.param({'body': 'error'}, HTTP_ERROR_MESSAGE, id='no_json'),
+    pytest.param({'json': 'error'}, HTTP_ERROR_MESSAGE, id='invalid_json'),
+])
+def test_handle_error_response(payload, expected_message, client, error_endpoints):
     job_id = '3141592653-abcd-1234'
     collection = Collection(id='C1940468263-POCLOUD')
     request = Request(
         collection=collection,
         spatial=BBox(-107, 40, -105, 42)
     )
-    responses.add(
-        responses.POST,
-        expected_submit_url(collection.id),
-        status=500,
-        json='error'
-    )
-    responses.add(
-        responses.GET,
-        expected_status_url(job_id),
-        status=500,
-        json='error'
-    )
-    responses.add(
-        responses.GET,
-        expected_status_url(job_id),
-        status=500,
-        json='error'
-    )
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).submit(request)
-    assert "500 Server Error: Internal Server Error for url" in str(e.value)
+    error_endpoints(collection.id, job_id, **payload)
 
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).status(job_id)
-    assert "500 Server Error: Internal Server Error for url" in str(e.value)
-
-    with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).progress(job_id)
-    assert "500 Server Error: Internal Server Error for url" in str(e.value)
+    for method, arg in ((client.submit, request), (client.status, job_id),
+                        (client.progress, job_id)):
+        with pytest.raises(Exception, match=expected_message):
+            method(arg)
 
-def test_request_as_curl_get():
+def test_request_as_curl_get(client):
     collection = Collection(id='C1940468263-POCLOUD')
     request = Request(
         collection=collection,
         spatial=BBox(-107, 40, -105, 42)
     )
 
-    curl_command = Client(should_validate_auth=False).request_as_curl(request)
+    curl_command = client.request_as_curl(request)
     assert f'https://harmony.earthdata.nasa.gov/{collection.id}' \
            f'/ogc-api-coverages/1.0.0/collections/parameter_vars/coverage/rangeset' in curl_command
     assert '-X POST' in curl_command
 
 
-def test_request_as_curl_post(examples_dir):
+def test_request_as_curl_post(asf_example, client):
     collection = Collection(id='C1940468263-POCLOUD')
     request = Request(
         collection=collection,
-        shape=os.path.join(examples_dir, 'asf_example.json'),
+        shape=asf_example,
         spatial=BBox(-107, 40, -105, 42)
     )
 
-    curl_command = Client(should_validate_auth=False).request_as_curl(request)
+    curl_command = client.request_as_curl(request)
     assert f'https://harmony.earthdata.nasa.gov/{collection.id}' \
            f'/ogc-api-coverages/1.0.0/collections/parameter_vars/coverage/rangeset' in curl_command
     assert '-X POST' in curl_command
 
-def test_request_as_url():
+def test_request_as_url(client):
     collection = Collection(id='C1940468263-POCLOUD')
     request = Request(
         collection=collection,
         spatial=BBox(-107, 40, -105, 42)
     )
 
-    url = Client(should_validate_auth=False).request_as_url(request)
+    url = client.request_as_url(request)
     assert url == f'https://harmony.earthdata.nasa.gov/C1940468263-POCLOUD/ogc-api-coverages/1.0.0/collections/parameter_vars/coverage/rangeset?forceAsync=true&subset=lat%2840%3A42%29&subset=lon%28-107%3A-105%29&label={DEFAULT_JOB_LABEL}&variable=all'
 
-def test_request_with_shapefile_as_url(examples_dir):
+def test_request_with_shapefile_as_url(asf_example, client):
     collection = Collection(id='C1940468263-POCLOUD')
     request = Request(
         collection=collection,
-        shape=os.path.join(examples_dir, 'asf_example.json'),
+        shape=asf_example,
         spatial=BBox(-107, 40, -105, 42)
     )
 
     with pytest.raises(Exception) as e:
-        Client(should_validate_auth=False).request_as_url(request)
+        client.request_as_url(request)
     assert str(e.value) == "Cannot include shapefile as URL query parameter"
 
 @responses.activate
-def test_collection_capabilities():
+def test_collection_capabilities(client):
     collection_id='C1940468263-POCLOUD'
     params = {'collection_id': collection_id}
     request = CapabilitiesRequest(collection_id=collection_id)
     responses.add(
         responses.GET,
-        expected_capabilities_url(params),
+        expected_capabilities_url(**params),
         status=200,
         json=expected_capabilities(collection_id)
     )
 
-    result = Client(should_validate_auth=False).submit(request)
+    result = client.submit(request)
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request is not None
-    assert responses.calls[0].request.url == expected_capabilities_url(params)
+    assert responses.calls[0].request.url == expected_capabilities_url(**params)
     assert result['conceptId'] == collection_id
     assert ('services' in result.keys())
     assert result['capabilitiesVersion'] == '2'
 
 
 @responses.activate
-def test_collection_capabilities_with_version():
+def test_collection_capabilities_with_version(client):
     collection_id = 'C1940468263-POCLOUD'
     capabilitiesVersion = '2'
     params = {'collection_id': collection_id,
@@ -1653,38 +1522,38 @@ def test_collection_capabilities_with_version():
                                   capabilities_version=capabilitiesVersion)
     responses.add(
         responses.GET,
-        expected_capabilities_url(params),
+        expected_capabilities_url(**params),
         status=200,
         json=expected_capabilities(collection_id)
     )
 
-    result = Client(should_validate_auth=False).submit(request)
+    result = client.submit(request)
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request is not None
-    assert responses.calls[0].request.url == expected_capabilities_url(params)
+    assert responses.calls[0].request.url == expected_capabilities_url(**params)
     assert result['conceptId'] == collection_id
     assert ('services' in result.keys())
     assert result['capabilitiesVersion'] == capabilitiesVersion
 
 @responses.activate
-def test_collection_capabilities_shortname():
+def test_collection_capabilities_shortname(client):
     collection_id='C1940468263-POCLOUD'
     short_name='SMAP_RSS_L3_SSS_SMI_8DAY-RUNNINGMEAN_V4'
     params = {'short_name': short_name}
     request = CapabilitiesRequest(short_name=short_name)
     responses.add(
         responses.GET,
-        expected_capabilities_url(params),
+        expected_capabilities_url(**params),
         status=200,
         json=expected_capabilities(collection_id)
     )
 
-    result = Client(should_validate_auth=False).submit(request)
+    result = client.submit(request)
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request is not None
-    assert responses.calls[0].request.url == expected_capabilities_url(params)
+    assert responses.calls[0].request.url == expected_capabilities_url(**params)
     assert result['conceptId'] == collection_id
     assert result['shortName'] == short_name
     assert ('services' in result.keys())
@@ -1692,7 +1561,7 @@ def test_collection_capabilities_shortname():
 
 
 @responses.activate
-def test_collection_capabilities_with_shortname_version():
+def test_collection_capabilities_with_shortname_version(client):
     collection_id = 'C1940468263-POCLOUD'
     short_name='SMAP_RSS_L3_SSS_SMI_8DAY-RUNNINGMEAN_V4'
     capabilitiesVersion = '2'
@@ -1702,16 +1571,16 @@ def test_collection_capabilities_with_shortname_version():
                                   capabilities_version=capabilitiesVersion)
     responses.add(
         responses.GET,
-        expected_capabilities_url(params),
+        expected_capabilities_url(**params),
         status=200,
         json=expected_capabilities(collection_id)
     )
 
-    result = Client(should_validate_auth=False).submit(request)
+    result = client.submit(request)
 
     assert len(responses.calls) == 1
     assert responses.calls[0].request is not None
-    assert responses.calls[0].request.url == expected_capabilities_url(params)
+    assert responses.calls[0].request.url == expected_capabilities_url(**params)
     assert result['conceptId'] == collection_id
     assert result['shortName'] == short_name
     assert ('services' in result.keys())
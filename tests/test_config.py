@@ -20,40 +20,30 @@ def test_config_built_in():
     assert config.NUM_REQUESTS_WORKERS is not None
 
 
-@pytest.mark.parametrize('env,url', [
-    (Environment.LOCAL, 'localhost'),
-    (Environment.SIT, 'harmony.sit.earthdata.nasa.gov'),
-    (Environment.UAT, 'harmony.uat.earthdata.nasa.gov'),
-    (Environment.PROD, 'harmony.earthdata.nasa.gov')
-])
-def test_harmony_hostname_matches_environment(env, url):
-    config = Config(env)
-
-    assert config.harmony_hostname == url
-
-
-@pytest.mark.parametrize('env,url', [
-    (Environment.LOCAL, 'http'),
-    (Environment.SIT, 'https'),
-    (Environment.UAT, 'https'),
-    (Environment.PROD, 'https')
-])
-def test_url_scheme_matches_environment(env, url):
-    config = Config(env)
-
-    assert config.url_scheme == url
-
-
-@pytest.mark.parametrize('env,url', [
-    (Environment.LOCAL, 'http://localhost:3000'),
-    (Environment.SIT, 'https://harmony.sit.earthdata.nasa.gov'),
-    (Environment.UAT, 'https://harmony.uat.earthdata.nasa.gov'),
-    (Environment.PROD, 'https://harmony.earthdata.nasa.gov')
+def test_config_built_in_overridden_by_env(monkeypatch):
+    monkeypatch.setenv('NUM_REQUESTS_WORKERS', '8')
+    config = Config()
+    assert config.NUM_REQUESTS_WORKERS == '8'
+    assert config.num_requests_workers == 8
+
+
+@pytest.mark.parametrize('env,hostname,scheme,root_url,edl_validation_url', [
+    (Environment.LOCAL, 'localhost', 'http', 'http://localhost:3000',
+     'http://localhost:3000/jobs'),
+    (Environment.SIT, 'harmony.sit.earthdata.nasa.gov', 'https',
+     'https://harmony.sit.earthdata.nasa.gov', 'https://harmony.sit.earthdata.nasa.gov/jobs'),
+    (Environment.UAT, 'harmony.uat.earthdata.nasa.gov', 'https',
+     'https://harmony.uat.earthdata.nasa.gov', 'https://harmony.uat.earthdata.nasa.gov/jobs'),
+    (Environment.PROD, 'harmony.earthdata.nasa.gov', 'https',
+     'https://harmony.earthdata.nasa.gov', 'https://harmony.earthdata.nasa.gov/jobs')
 ])
-def test_root_url_matches_environment(env, url):
+def test_urls_match_environment(env, hostname, scheme, root_url, edl_validation_url):
     config = Config(env)
 
-    assert config.root_url == url
+    assert config.harmony_hostname == hostname
+    assert config.url_scheme == scheme
+    assert config.root_url == root_url
+    assert config.edl_validation_url == edl_validation_url
 
 
 @pytest.mark.parametrize('env,url', [
@@ -68,13 +58,28 @@ def test_localhost_port_is_overridable(env, url):
     assert config.root_url == url
 
 
-@pytest.mark.parametrize('env,url', [
-    (Environment.LOCAL, 'http://localhost:3000/jobs'),
-    (Environment.SIT, 'https://harmony.sit.earthdata.nasa.gov/jobs'),
-    (Environment.UAT, 'https://harmony.uat.earthdata.nasa.gov/jobs'),
-    (Environment.PROD, 'https://harmony.earthdata.nasa.gov/jobs')
-])
-def test_edl_validation_url_matches_environment(env, url):
-    config = Config(env)
+@pytest.mark.parametrize('name', ['harmony_hostname', 'url_scheme', 'root_url',
+                                  'edl_validation_url'])
+def test_urls_are_overridable_by_env(name, monkeypatch):
+    monkeypatch.setenv(name.upper(), 'https://harmony.example.com')
+    config = Config()
+
+    assert getattr(config, name) == 'https://harmony.example.com'
+
+
+@pytest.mark.parametrize('name', ['EDL_USERNAME', 'foo'])
+def test_config_attributes_cannot_be_set(name):
+    config = Config()
+
+    with pytest.raises(AttributeError):
+        setattr(config, name, 'bar')
+
+
+def test_config_built_in_is_read_once(monkeypatch):
+    monkeypatch.setenv('NUM_REQUESTS_WORKERS', '8')
+    config = Config()
+    monkeypatch.setenv('NUM_REQUESTS_WORKERS', '16')
+    monkeypatch.setenv('FOO', 'bar')
 
-    assert config.edl_validation_url == url
+    assert config.NUM_REQUESTS_WORKERS == '8'
+    assert config.FOO == 'bar'
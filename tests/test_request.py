@@ -1,9 +1,79 @@
 import datetime as dt
 
-from hypothesis import given, settings, strategies as st
+from hypothesis import example, given, strategies as st
 import pytest
 
-from harmony.harmony import BBox, WKT, Collection, BaseRequest, Request, CapabilitiesRequest, Dimension
+from harmony.harmony import BBox, WKT, Collection, BaseRequest, Request, CapabilitiesRequest, \
+    Dimension, is_wkt_valid
+
+# Requests never modify their collection, so tests can share these
+FOO = Collection('foo')
+FOOBAR = Collection('foobar')
+
+FLOATS = st.floats(allow_infinity=True)
+BBOX_TUPLES = st.tuples(FLOATS, FLOATS, FLOATS, FLOATS)
+DIMENSION_BOUNDS = st.one_of(st.floats(-1000.0, 1000.0), st.integers(-1000, 1000))
+DIMENSIONS = st.builds(Dimension, st.just('foo'), DIMENSION_BOUNDS, DIMENSION_BOUNDS)
+
+BBOX_ERROR_CASES = (
+    ('spatial', BBox(10, -10, 20, -20), 'Southern latitude must be less than or equal to Northern latitude'),
+    ('spatial', BBox(10, -100, 20, 20), 'Southern latitude must be greater than -90.0'),
+    ('spatial', BBox(10, -110, 20, -100), 'Northern latitude must be greater than -90.0'),
+    ('spatial', BBox(10, 100, 20, 110), 'Southern latitude must be less than 90.0'),
+    ('spatial', BBox(10, 10, 20, 100), 'Northern latitude must be less than 90.0'),
+    ('spatial', BBox(-190, 10, 20, 20), 'Western longitude must be greater than -180.0'),
+    ('spatial', BBox(-200, 10, -190, 20), 'Eastern longitude must be greater than -180.0'),
+    ('spatial', BBox(10, 10, 190, 20), 'Eastern longitude must be less than 180.0'),
+    ('spatial', BBox(190, 10, 200, 20), 'Western longitude must be less than 180.0'),
+)
+
+WKT_ERROR_CASES = (
+    ('spatial', WKT('BBOX(-140,20,-50,60)'), 'WKT BBOX(-140,20,-50,60) is invalid'),
+    ('spatial', WKT('APOINT(0 51.48)'), 'WKT APOINT(0 51.48) is invalid'),
+    ('spatial', WKT('CIRCULARSTRING(0 0, 1 1, 1 0)'), 'WKT CIRCULARSTRING(0 0, 1 1, 1 0) is invalid'),
+)
+
+
+@pytest.fixture
+def empty_wkt_cache():
+    """Clears the process-wide WKT validity cache around a test, so cached results (and
+    their parse error output) never leak between tests.
+    """
+    is_wkt_valid.cache_clear()
+    yield
+    is_wkt_valid.cache_clear()
+
+
+@st.composite
+def valid_bboxes(draw):
+    """Draws in-range BBoxes with south <= north. West may exceed east (antimeridian)."""
+    south, north = sorted(draw(st.lists(st.floats(-90.0, 90.0), min_size=2, max_size=2)))
+    return BBox(draw(st.floats(-180.0, 180.0)), south, draw(st.floats(-180.0, 180.0)), north)
+
+
+@st.composite
+def invalid_bboxes(draw):
+    """Draws BBoxes with one bound out of range or NaN, or with south > north."""
+    bbox = list(draw(valid_bboxes()))
+    index = draw(st.integers(0, 4))
+    if index == 4:
+        south, north = sorted(draw(st.lists(st.floats(-90.0, 90.0), min_size=2, max_size=2,
+                                            unique=True)), reverse=True)
+        bbox[1], bbox[3] = south, north
+    else:
+        limit = 180.0 if index % 2 == 0 else 90.0
+        bbox[index] = draw(st.floats(min_value=limit, exclude_min=True)
+                           | st.floats(max_value=-limit, exclude_max=True)
+                           | st.just(float('nan')))
+    return BBox(*bbox)
+
+
+@st.composite
+def valid_temporal_ranges(draw):
+    """Draws temporal dicts with a start, a stop, or a start strictly before a stop."""
+    start, stop = sorted(draw(st.lists(st.datetimes(), min_size=2, max_size=2, unique=True)))
+    keys = draw(st.sampled_from([('start', 'stop'), ('start',), ('stop',)]))
+    return {key: value for key, value in zip(('start', 'stop'), (start, stop)) if key in keys}
 
 
 def test_request_has_collection_with_id():
@@ -18,68 +88,74 @@ def test_transformation_request_has_collection_with_id():
     assert request.collection.id == 'foobar'
 
 def test_request_with_only_a_collection():
-    request = Request(collection=Collection('foobar'))
-    assert request.is_valid()
-
-def test_request_with_skip_preview_false():
-    request = Request(collection=Collection('foobar'), skip_preview=False)
+    request = Request(collection=FOOBAR)
     assert request.is_valid()
-    assert request.skip_preview is not None and request.skip_preview == False
 
-def test_request_with_skip_preview_true():
-    request = Request(collection=Collection('foobar'), skip_preview=True)
+@pytest.mark.parametrize('kwargs, attr, expected', [
+    ({'skip_preview': False}, 'skip_preview', False),
+    ({'skip_preview': True}, 'skip_preview', True),
+    ({'ignore_errors': False}, 'ignore_errors', False),
+    ({'ignore_errors': True}, 'ignore_errors', True),
+])
+def test_request_with_boolean_option(kwargs, attr, expected):
+    request = Request(collection=FOOBAR, **kwargs)
     assert request.is_valid()
-    assert request.skip_preview is not None and request.skip_preview == True
+    assert getattr(request, attr) is expected
 
-def test_request_defaults_to_skip_preview_false():
-    request = Request(collection=Collection('foobar'))
-    assert not request.skip_preview
+@pytest.mark.parametrize('attr', ['skip_preview', 'ignore_errors'])
+def test_request_defaults_boolean_option_to_false(attr):
+    request = Request(collection=FOOBAR)
+    assert not getattr(request, attr)
 
-def test_request_with_ignore_errors_false():
-    request = Request(collection=Collection('foobar'), ignore_errors=False)
-    assert request.is_valid()
-    assert request.ignore_errors is not None and request.ignore_errors == False
+@given(spatial=valid_bboxes())
+@example(spatial=BBox(-180.0, -90.0, 180.0, 90.0))
+@example(spatial=BBox(180.0, 90.0, -180.0, 90.0))
+def test_request_spatial_bounding_box(spatial):
+    request = Request(
+        collection=FOOBAR,
+        spatial=spatial,
+    )
 
-def test_request_with_ignore_errors_true():
-    request = Request(collection=Collection('foobar'), ignore_errors=True)
     assert request.is_valid()
-    assert request.ignore_errors is not None and request.ignore_errors == True
-
-def test_request_defaults_to_ignore_errors_false():
-    request = Request(collection=Collection('foobar'))
-    assert not request.ignore_errors
-
-@settings(max_examples=100)
-@given(west=st.floats(allow_infinity=True),
-       south=st.floats(allow_infinity=True),
-       east=st.floats(allow_infinity=True),
-       north=st.floats(allow_infinity=True))
-def test_request_spatial_bounding_box(west, south, east, north):
-    spatial = BBox(west, south, east, north)
+    assert request.spatial == spatial
+
+@given(spatial=invalid_bboxes())
+@example(spatial=BBox(-180.1, -90.0, 180.0, 90.0))
+@example(spatial=BBox(-180.0, -90.0, 180.0, 90.1))
+@example(spatial=BBox(float('nan'), -90.0, 180.0, 90.0))
+@example(spatial=BBox(-180.0, 10.0, 180.0, -10.0))
+def test_request_spatial_bounding_box_is_invalid(spatial):
     request = Request(
-        collection=Collection('foobar'),
+        collection=FOOBAR,
         spatial=spatial,
     )
 
-    if request.is_valid():
-        assert request.spatial is not None
-        w, s, e, n = request.spatial
-        assert w == west
-        assert s == south
-        assert e == east
-        assert n == north
+    assert not request.is_valid()
+
+@given(bboxes=st.lists(invalid_bboxes(), min_size=1, max_size=20))
+def test_request_validate_bboxes_rejects_invalid_bboxes(bboxes):
+    pytest.importorskip('numpy')
+
+    assert not Request.validate_bboxes(bboxes).any()
+
+@given(bboxes=st.lists(BBOX_TUPLES, min_size=1, max_size=20))
+def test_request_validate_bboxes_matches_is_valid(bboxes):
+    pytest.importorskip('numpy')
+    expected = [Request(FOOBAR, spatial=BBox(*bb)).is_valid() for bb in bboxes]
 
-        assert south <= north
+    assert list(Request.validate_bboxes(bboxes)) == expected
 
-        assert south >= -90.0
-        assert north >= -90.0
-        assert south <= 90.0
-        assert north <= 90.0
+@pytest.mark.parametrize('bboxes', [
+    [[[10, 20], [30, 40]]],
+    [[-130, 30, -100, 60, 10, -10, 20, -20]],
+    [-130, 30, -100, 60],
+    [[-130, 30, -100]],
+])
+def test_request_validate_bboxes_rejects_malformed_shapes(bboxes):
+    pytest.importorskip('numpy')
 
-        assert west >= -180.0
-        assert east >= -180.0
-        assert west <= 180.0
-        assert east <= 180.0
+    with pytest.raises(ValueError, match=r'Bounding boxes must have shape \(N, 4\)'):
+        Request.validate_bboxes(bboxes)
 
 @pytest.mark.parametrize('key, value', [
     ('spatial', WKT('POINT(0 51.48)')),
@@ -90,61 +166,47 @@ def test_request_spatial_bounding_box(west, south, east, north):
     ('spatial', WKT('MULTILINESTRING((10 10, 20 20, 10 40),(40 40, 30 30, 40 20, 30 10))')),
     ('spatial', WKT('MULTIPOLYGON(((30 20, 45 40, 10 40, 30 20)),((15 5, 40 10, 10 20, 5 10, 15 5)))')),
 ])
-def test_request_spatial_wkt(key, value):
-    request = Request(Collection('foo'), **{key: value})
+def test_request_spatial_wkt(key, value, empty_wkt_cache):
+    request = Request(FOO, **{key: value})
+    assert request.is_valid()
+
+def test_request_wkt_is_parsed_once(mocker, empty_wkt_cache):
+    loads = mocker.patch('harmony.harmony.loads')
+    request = Request(FOO, spatial=WKT('POINT(-77.03 38.89)'))
+
     assert request.is_valid()
+    assert request.error_messages() == []
+    loads.assert_called_once_with('POINT(-77.03 38.89)')
 
-@settings(max_examples=100)
-@given(key_a=st.one_of(st.none(), st.sampled_from(['start', 'stop']), st.text()),
-       key_b=st.one_of(st.none(), st.sampled_from(['start', 'stop']), st.text()),
-       datetime_a=st.datetimes(),
-       datetime_b=st.datetimes())
-def test_request_temporal_range(key_a, key_b, datetime_a, datetime_b):
-    temporal = {
-        key_a: datetime_a,
-        key_b: datetime_b
-    }
+@given(temporal=valid_temporal_ranges())
+@example(temporal={})
+@example(temporal={'start': dt.datetime.min, 'stop': dt.datetime.max})
+def test_request_temporal_range(temporal):
     request = Request(
-        collection=Collection('foobar'),
+        collection=FOOBAR,
         temporal=temporal
     )
 
-    if request.is_valid():
-        assert request.temporal is not None
-        assert 'start' in request.temporal or 'stop' in request.temporal
-        if 'start' in request.temporal and 'stop' in request.temporal:
-            assert request.temporal['start'] < request.temporal['stop']
-
-@settings(max_examples=100)
-@given(min=st.one_of(st.floats(allow_infinity=True), st.integers()),
-       max=st.one_of(st.floats(allow_infinity=True), st.integers()))
-def test_request_dimensions(min, max):
-    dimension = Dimension('foo', min, max)
+    assert request.is_valid()
+    assert request.temporal == temporal
+
+@given(dimension=DIMENSIONS)
+@example(dimension=Dimension('foo', 10, 10))
+@example(dimension=Dimension('foo', None, 10.0))
+def test_request_dimensions(dimension):
     request = Request(
-        collection=Collection('foobar'),
+        collection=FOOBAR,
         dimensions=[dimension],
     )
 
     if request.is_valid():
         assert len(request.dimensions) == 1
-        min_actual = request.dimensions[0].min
-        max_actual = request.dimensions[0].max
-        assert min == min_actual
-        assert max == max_actual
+        assert request.dimensions[0].min == dimension.min
+        assert request.dimensions[0].max == dimension.max
 
-@pytest.mark.parametrize('key, value, message', [
-    ('spatial', BBox(10, -10, 20, -20), 'Southern latitude must be less than or equal to Northern latitude'),
-    ('spatial', BBox(10, -100, 20, 20), 'Southern latitude must be greater than -90.0'),
-    ('spatial', BBox(10, -110, 20, -100), 'Northern latitude must be greater than -90.0'),
-    ('spatial', BBox(10, 100, 20, 110), 'Southern latitude must be less than 90.0'),
-    ('spatial', BBox(10, 10, 20, 100), 'Northern latitude must be less than 90.0'),
-    ('spatial', BBox(-190, 10, 20, 20), 'Western longitude must be greater than -180.0'),
-    ('spatial', BBox(-200, 10, -190, 20), 'Eastern longitude must be greater than -180.0'),
-    ('spatial', BBox(10, 10, 190, 20), 'Eastern longitude must be less than 180.0'),
-    ('spatial', BBox(190, 10, 200, 20), 'Western longitude must be less than 180.0'),
-])
-def test_request_spatial_error_messages(key, value, message):
-    request = Request(Collection('foo'), **{key: value})
+@pytest.mark.parametrize('key, value, message', BBOX_ERROR_CASES + WKT_ERROR_CASES)
+def test_request_spatial_error_messages(key, value, message, empty_wkt_cache):
+    request = Request(FOO, **{key: value})
     messages = request.error_messages()
 
     assert not request.is_valid()
@@ -158,19 +220,7 @@ def test_request_spatial_error_messages(key, value, message):
 ])
 def test_request_dimensions_error_messages(value):
     message = 'Dimension minimum value must be less than or equal to the maximum value'
-    request = Request(Collection('foo'), **{'dimensions': value})
-    messages = request.error_messages()
-
-    assert not request.is_valid()
-    assert message in messages
-
-@pytest.mark.parametrize('key, value, message', [
-    ('spatial', WKT('BBOX(-140,20,-50,60)'), 'WKT BBOX(-140,20,-50,60) is invalid'),
-    ('spatial', WKT('APOINT(0 51.48)'), 'WKT APOINT(0 51.48) is invalid'),
-    ('spatial', WKT('CIRCULARSTRING(0 0, 1 1, 1 0)'), 'WKT CIRCULARSTRING(0 0, 1 1, 1 0) is invalid'),
-])
-def test_request_spatial_error_messages(key, value, message):
-    request = Request(Collection('foo'), **{key: value})
+    request = Request(FOO, **{'dimensions': value})
     messages = request.error_messages()
 
     assert not request.is_valid()
@@ -192,7 +242,7 @@ def test_request_spatial_error_messages(key, value, message):
     )
 ])
 def test_request_temporal_error_messages(key, value, message):
-    request = Request(Collection('foo'), **{key: value})
+    request = Request(FOO, **{key: value})
     messages = request.error_messages()
 
     assert not request.is_valid()
@@ -200,7 +250,7 @@ def test_request_temporal_error_messages(key, value, message):
 
 
 def test_request_valid_shape():
-    request = Request(Collection('foo'), shape='./examples/asf_example.json')
+    request = Request(FOO, shape='./examples/asf_example.json')
     messages = request.error_messages()
     assert request.is_valid()
     assert messages == []
@@ -213,13 +263,13 @@ def test_request_valid_shape():
       + 'Valid file extensions: [json, geojson, kml, shz, zip]']),
 ])
 def test_request_shape_file_error_message(key, value, messages):
-    request = Request(Collection('foo'), **{key: value})
+    request = Request(FOO, **{key: value})
 
     assert not request.is_valid()
     assert request.error_messages() == messages
 
 def test_request_destination_url_error_message():
-    request = Request(Collection('foo'), destination_url='http://somesite.com')
+    request = Request(FOO, destination_url='http://somesite.com')
     messages = request.error_messages()
 
     assert not request.is_valid()
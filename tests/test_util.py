@@ -1,14 +1,18 @@
-import pytest
+import string
+
+from hypothesis import example, given, strategies as st
 
 from harmony.util import s3_components
 
+SEGMENTS = st.text(alphabet=string.ascii_lowercase + string.digits + '-_', min_size=1, max_size=16)
+
 
-@pytest.mark.parametrize('bucket, path, fn', [
-    ('harmony-uat-staging', 'public/harmony/gdal/aed38eeb-f01a-41bb-a790-affbb2ab2bd6',
-     '2020_01_01_7f00ff_global_blue_var_regridded_subsetted.nc.tif'),
-    ('foo', 'bar', 'xyzzy.txt'),
-    ('foo', '', 'xyzzy.nc')
-])
+@given(bucket=SEGMENTS, path=st.lists(SEGMENTS, max_size=3).map('/'.join), fn=SEGMENTS)
+@example(bucket='harmony-uat-staging',
+         path='public/harmony/gdal/aed38eeb-f01a-41bb-a790-affbb2ab2bd6',
+         fn='2020_01_01_7f00ff_global_blue_var_regridded_subsetted.nc.tif')
+@example(bucket='foo', path='bar', fn='xyzzy.txt')
+@example(bucket='foo', path='', fn='xyzzy.nc')
 def test_s3_url_parts(bucket, path, fn):
     key = f'{path}/{fn}' if path else fn
     url = f's3://{bucket}/{key}'